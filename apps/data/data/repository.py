@@ -1,5 +1,7 @@
 """Data access layer for VesselDataUpload (SQLAlchemy / SQLite)."""
 
+from collections.abc import Sequence
+
 from common.repository import BaseRepository
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -13,7 +15,7 @@ class UploadRepository(BaseRepository[VesselDataUpload]):
 
     def list_by_vessel(
         self, vessel_id: int, *, offset: int = 0, limit: int = 10
-    ) -> list[VesselDataUpload]:
+    ) -> Sequence[VesselDataUpload]:
         stmt = (
             select(VesselDataUpload)
             .where(VesselDataUpload.vessel_id == vessel_id)
@@ -21,4 +23,4 @@ class UploadRepository(BaseRepository[VesselDataUpload]):
             .offset(offset)
             .limit(limit)
         )
-        return list(self.session.scalars(stmt).all())
+        return self.session.scalars(stmt).all()
@@ -2,6 +2,7 @@
 
 import logging
 import math
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -47,7 +48,7 @@ class DataService:
 
     def list_upload_history(
         self, vessel_id: int, offset: int, limit: int
-    ) -> list[VesselDataUpload]:
+    ) -> Sequence[VesselDataUpload]:
         return self.repo.list_by_vessel(vessel_id, offset=offset, limit=limit)
 
     # ── Background processing pipeline ──────────────────────────────────────
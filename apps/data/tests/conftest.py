@@ -79,7 +79,9 @@ def client(engine, tmp_duck_path, tmp_path):
     - data.service._SessionFactory → SQLite → in-memory
     - data.service.get_duck_conn → DuckDB → tmp file
     - data.router.settings     → upload_dir → tmp_path
+    - data.app.engine          → SQLite → in-memory (no shared file under pytest -n)
     """
+    import data.app as app_module
     import data.database as db_module
     import data.router as router_module
     import data.service as svc_module
@@ -91,9 +93,11 @@ def client(engine, tmp_duck_path, tmp_path):
     orig_svc_factory = svc_module._SessionFactory
     orig_svc_duck = svc_module.get_duck_conn
     orig_router_settings = router_module.settings
+    orig_app_engine = app_module.engine
 
     db_module.settings = test_duck_settings
     svc_module._SessionFactory = test_factory
+    app_module.engine = engine
     svc_module.get_duck_conn = lambda: duckdb.connect(tmp_duck_path)
     router_module.settings = Settings(
         duck_db_path=tmp_duck_path,
@@ -121,3 +125,4 @@ def client(engine, tmp_duck_path, tmp_path):
     svc_module._SessionFactory = orig_svc_factory
     svc_module.get_duck_conn = orig_svc_duck
     router_module.settings = orig_router_settings
+    app_module.engine = orig_app_engine
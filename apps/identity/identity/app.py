@@ -8,6 +8,7 @@ from pathlib import Path
 from common.exceptions import setup_exception_handlers
 from common.logging import setup_logging
 from common.models import Base
+from common.responses import FastORJSONResponse
 from common.schemas import ResponseModel
 from fastapi import FastAPI, Request
 from sqlalchemy import text
@@ -42,6 +43,7 @@ def create_app() -> FastAPI:
         description="船舶能效分析平台 - 公司管理与用户认证微服务",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=FastORJSONResponse,
     )
 
     setup_exception_handlers(application)
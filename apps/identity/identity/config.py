@@ -22,9 +22,16 @@ class Settings(BaseSettings):
     port: int = 8001
     vessel_service_url: str = "http://localhost:9002"
 
+    # Every authenticated request holds a connection; the SQLAlchemy default (5 + 10
+    # overflow) becomes the concurrency cap under login bursts.
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle: int = 3600
+
     jwt_secret_key: str = "change-me-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 30
+    bcrypt_rounds: int = 12
 
 
 @lru_cache
@@ -7,7 +7,14 @@ from sqlalchemy.orm import Session
 
 from identity.config import settings
 
-engine = create_engine_from_url(settings.database_url, echo=settings.debug)
+engine = create_engine_from_url(
+    settings.database_url,
+    echo=settings.debug,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+)
 SessionLocal = create_session_factory(engine)
 
 
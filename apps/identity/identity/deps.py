@@ -4,23 +4,30 @@ from typing import Annotated
 
 from common.auth import decode_token
 from common.exceptions import AuthenticationError, EntityNotFoundError
-from fastapi import Depends, Header
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from fastapi import Depends
+from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.orm import Session, load_only
 
 from identity.config import settings
 from identity.database import get_db
 from identity.models import User
+from identity.repository import UserRepository
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/user/login", auto_error=False)
+# Declared as security schemes so OpenAPI documents both ways to send the token. With
+# auto_error=False each one only reads its header and yields None when it is absent.
+_bearer_scheme = HTTPBearer(auto_error=False)
+_token_header_scheme = APIKeyHeader(name="Token", auto_error=False)
 
 
-def _get_token(
-    bearer_token: str | None = Depends(oauth2_scheme),
-    token_header: str | None = Header(None, alias="Token"),
+async def _get_token(
+    bearer: HTTPAuthorizationCredentials | None = Depends(_bearer_scheme),
+    token_header: str | None = Depends(_token_header_scheme),
 ) -> str:
-    """Accept tokens via Authorization: Bearer or a custom Token header."""
-    token = bearer_token or token_header
+    """Accept tokens via Authorization: Bearer or a custom Token header.
+
+    Declared async: it only reads headers, so it need not hop to the threadpool.
+    """
+    token = bearer.credentials if bearer else token_header
     if not token:
         raise AuthenticationError("Not authenticated")
     return token
@@ -30,21 +37,13 @@ def get_current_user(
     token: Annotated[str, Depends(_get_token)],
     session: Session = Depends(get_db),
 ) -> User:
-    """Resolve the currently authenticated user from the JWT token."""
+    """Resolve the currently authenticated, non-disabled user from the JWT token."""
     payload = decode_token(
         token, secret_key=settings.jwt_secret_key, algorithm=settings.jwt_algorithm
     )
     user_id = int(payload["sub"])
-    user = session.get(User, user_id)
+    # Runs on every authenticated request; only id/disabled are needed downstream.
+    user = UserRepository(session).get_active_by_id(user_id, load_only(User.id, User.disabled))
     if not user:
         raise EntityNotFoundError("User", user_id)
     return user
-
-
-def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
-    """Ensure the current user is not disabled."""
-    if current_user.disabled:
-        raise EntityNotFoundError("User", current_user.id)
-    return current_user
@@ -1,7 +1,7 @@
 """SQLAlchemy models for the identity service."""
 
 from common.models import Base, IntIDMixin, TimestampMixin
-from sqlalchemy import Boolean, ForeignKey, Integer, String
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, String, false
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -23,5 +23,17 @@ class User(IntIDMixin, TimestampMixin, Base):
     phone: Mapped[str] = mapped_column(String(20))
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
     is_system_admin: Mapped[bool] = mapped_column(Boolean, default=False)
-    disabled: Mapped[bool] = mapped_column(Boolean, default=False)
+    disabled: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default=false()
+    )
     company_id: Mapped[int] = mapped_column(Integer, ForeignKey("company.id"))
+
+
+# Partial index over the active subset: user list/lookup queries always filter on
+# ``disabled IS false``, so they never need to visit disabled rows.
+Index(
+    "ix_user_active",
+    User.company_id,
+    sqlite_where=User.disabled.is_(False),
+    postgresql_where=User.disabled.is_(False),
+)
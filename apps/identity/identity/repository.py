@@ -1,24 +1,39 @@
 """Data access layer for the identity service."""
 
+from collections.abc import Sequence
+
 from common.repository import BaseRepository
 from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import ExecutableOption
 
 from identity.models import Company, User
 
 
 class CompanyRepository(BaseRepository[Company]):
+    __slots__ = ()
+
     def __init__(self, session: Session):
         super().__init__(session, Company)
 
-    def list_all_companies(self) -> list[Company]:
-        return list(self.session.scalars(select(Company)).all())
+    def list_all_companies(self) -> Sequence[Company]:
+        return self.session.scalars(select(Company)).all()
 
 
 class UserRepository(BaseRepository[User]):
+    __slots__ = ()
+
     def __init__(self, session: Session):
         super().__init__(session, User)
 
+    def get_active_by_id(self, user_id: int, *options: ExecutableOption) -> User | None:
+        stmt = select(User).options(*options).where(User.id == user_id, User.disabled.is_(False))
+        return self.session.scalars(stmt).one_or_none()
+
+    def list_active_by_ids(self, user_ids: list[int]) -> Sequence[User]:
+        stmt = select(User).where(User.id.in_(user_ids), User.disabled.is_(False))
+        return self.session.scalars(stmt).all()
+
     def find_by_username(self, username: str) -> User | None:
         stmt = select(User).where(User.username == username)
         return self.session.scalars(stmt).first()
@@ -29,11 +44,11 @@ class UserRepository(BaseRepository[User]):
         company_id: int | None = None,
         offset: int = 0,
         limit: int = 10,
-    ) -> list[User]:
-        stmt = select(User).where(User.disabled == False)  # noqa: E712
+    ) -> Sequence[User]:
+        stmt = select(User).where(User.disabled.is_(False))
         if name:
             stmt = stmt.where(User.username.like(f"%{name}%"))
         if company_id is not None:
             stmt = stmt.where(User.company_id == company_id)
         stmt = stmt.offset(offset).limit(limit)
-        return list(self.session.scalars(stmt).all())
+        return self.session.scalars(stmt).all()
@@ -1,10 +1,16 @@
 """API routes for the identity service."""
 
+from typing import Annotated
+
+from common.responses import FastORJSONResponse
 from common.schemas import ResponseModel
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from identity.database import get_db
+from identity.deps import get_current_user
+from identity.models import Company, User
 from identity.repository import CompanyRepository, UserRepository
 from identity.schemas import (
     CompanyCreate,
@@ -18,6 +24,38 @@ from identity.schemas import (
 )
 from identity.service import CompanyService, UserService
 
+# List endpoints build their JSON body directly, skipping FastAPI's validation pass over
+# ``response_model`` (kept on the decorator for OpenAPI only).
+_COMPANY_LIST_ADAPTER = TypeAdapter(list[CompanySchema])
+_USER_LIST_ADAPTER = TypeAdapter(list[UserSchema])
+
+
+# Rows loaded from the database already satisfy the column types, so list endpoints build
+# schemas with model_construct and skip per-row validation.
+def _company_to_schema(c: Company) -> CompanySchema:
+    return CompanySchema.model_construct(
+        id=c.id,
+        name=c.name,
+        address=c.address,
+        contact_person=c.contact_person,
+        contact_phone=c.contact_phone,
+        contact_email=c.contact_email,
+        created_at=c.created_at,
+    )
+
+
+def _user_to_schema(u: User) -> UserSchema:
+    return UserSchema.model_construct(
+        id=u.id,
+        username=u.username,
+        phone=u.phone,
+        company_id=u.company_id,
+        is_admin=u.is_admin,
+        is_system_admin=u.is_system_admin,
+        disabled=u.disabled,
+    )
+
+
 # --- Company Router ---
 
 company_router = APIRouter(prefix="/company", tags=["公司"])
@@ -31,13 +69,20 @@ def get_company_service(session: Session = Depends(get_db)) -> CompanyService:
     "",
     summary="获取所有公司",
     description="返回系统内所有公司列表，无分页。",
+    response_model=ResponseModel[list[CompanySchema]],
 )
 def get_companies(
     service: CompanyService = Depends(get_company_service),
-) -> ResponseModel[list[CompanySchema]]:
+) -> FastORJSONResponse:
     companies = service.get_all_companies()
-    data = [CompanySchema.model_validate(c) for c in companies]
-    return ResponseModel(data=data, message="获取公司列表成功")
+    data = [_company_to_schema(c) for c in companies]
+    return FastORJSONResponse(
+        {
+            "code": 200,
+            "data": _COMPANY_LIST_ADAPTER.dump_python(data),
+            "message": "获取公司列表成功",
+        }
+    )
 
 
 @company_router.post(
@@ -119,6 +164,7 @@ def get_user_service(session: Session = Depends(get_db)) -> UserService:
     "",
     summary="获取用户列表",
     description="获取未禁用的用户列表，支持按用户名模糊搜索和公司过滤，支持分页。",
+    response_model=ResponseModel[list[UserSchema]],
 )
 def get_user_list(
     name: str | None = Query(None, description="用户名(模糊搜索)"),
@@ -126,10 +172,51 @@ def get_user_list(
     offset: int = Query(0, description="偏移量"),
     limit: int = Query(10, description="每页数量"),
     service: UserService = Depends(get_user_service),
-) -> ResponseModel[list[UserSchema]]:
+) -> FastORJSONResponse:
     users = service.get_user_list(name, company_id, offset, limit)
-    data = [UserSchema.model_validate(u) for u in users]
-    return ResponseModel(data=data, message="获取成功")
+    data = [_user_to_schema(u) for u in users]
+    return FastORJSONResponse(
+        {"code": 200, "data": _USER_LIST_ADAPTER.dump_python(data), "message": "获取成功"}
+    )
+
+
+UserIdList = Annotated[
+    list[int],
+    Body(max_length=100, description="用户ID列表（最多 100 个）", examples=[[1, 2, 3]]),
+]
+
+
+def _user_map(users: dict[int, User | None]) -> dict[int, UserSchema | None]:
+    return {uid: _user_to_schema(u) if u else None for uid, u in users.items()}
+
+
+@user_router.post(
+    "/batch",
+    summary="批量获取用户",
+    description="按 ID 列表批量获取用户，单次查询完成。返回以用户 ID 为键、按请求顺序排列的映射；"
+    "被禁用或不存在的用户对应 null。",
+)
+def get_users_batch(
+    user_ids: UserIdList,
+    service: UserService = Depends(get_user_service),
+) -> ResponseModel[dict[int, UserSchema | None]]:
+    users = service.get_users_by_ids(user_ids)
+    return ResponseModel(data=_user_map(users), message="获取成功")
+
+
+@user_router.post(
+    "/introspect-batch",
+    summary="校验 token 并批量获取用户",
+    description="先校验请求携带的 token（Authorization: Bearer 或 Token 头），"
+    "再按 ID 列表批量获取用户，返回格式同 `/user/batch`。token 无效时返回 401。",
+)
+def introspect_users_batch(
+    user_ids: UserIdList,
+    _current_user: User = Depends(get_current_user),
+    service: UserService = Depends(get_user_service),
+) -> ResponseModel[dict[int, UserSchema | None]]:
+    users = service.get_users_by_ids(user_ids)
+    return ResponseModel(data=_user_map(users), message="获取成功")
 
 
 @user_router.post(
@@ -1,11 +1,19 @@
 """Business logic for the identity service."""
 
 import json
+import os
+import threading
+from collections.abc import Sequence
 from datetime import timedelta
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
-from common.auth import create_access_token, get_password_hash, verify_password
+from common.auth import (
+    cached_password_check,
+    create_access_token,
+    get_password_hash,
+    verify_password_cached,
+)
 from common.exceptions import AuthenticationError, EntityNotFoundError
 
 from identity.config import settings
@@ -15,17 +23,36 @@ from identity.schemas import (
     CompanyCreate,
     CompanyUpdate,
     UserRegisterData,
-    UserSchema,
     UserUpdate,
     UserWithToken,
 )
 
+# bcrypt is CPU-bound: cap concurrent hashing at the core count so that bursts of
+# logins/registrations cannot keep every worker thread busy hashing at once.
+_HASH_SLOTS = threading.BoundedSemaphore(os.cpu_count() or 2)
+
+
+def _hash_password(password: str) -> str:
+    with _HASH_SLOTS:
+        return get_password_hash(password, settings.bcrypt_rounds)
+
+
+def _verify_password(password: str, hashed_password: str) -> bool:
+    # Remembered successes skip the queue; everything else waits for a bcrypt slot.
+    hit = cached_password_check(password, hashed_password)
+    if hit is not None:
+        return hit
+    with _HASH_SLOTS:
+        return verify_password_cached(password, hashed_password)
+
 
 class CompanyService:
+    __slots__ = ("repo",)
+
     def __init__(self, repo: CompanyRepository):
         self.repo = repo
 
-    def get_all_companies(self) -> list[Company]:
+    def get_all_companies(self) -> Sequence[Company]:
         return self.repo.list_all_companies()
 
     def get_company_by_id(self, company_id: int) -> Company:
@@ -55,7 +82,7 @@ class CompanyService:
     def get_company_vessels(self, company_id: int) -> list[dict]:
         # Keep old API compatibility by delegating vessel lookup to vessel service.
         self.get_company_by_id(company_id)
-        query = urlencode({"company_id": company_id, "offset": 0, "limit": 1000})
+        query = urlencode({"company_id": company_id, "limit": 1000})
         url = f"{settings.vessel_service_url}/vessel?{query}"
         try:
             with urlopen(url, timeout=5) as response:
@@ -67,28 +94,35 @@ class CompanyService:
 
 
 class UserService:
+    __slots__ = ("repo",)
+
     def __init__(self, repo: UserRepository):
         self.repo = repo
 
     def get_user_by_id(self, user_id: int) -> User:
-        user = self.repo.get_or_raise(user_id)
-        if user.disabled:
+        user = self.repo.get_active_by_id(user_id)
+        if not user:
             raise EntityNotFoundError("User", user_id)
         return user
 
+    def get_users_by_ids(self, user_ids: list[int]) -> dict[int, User | None]:
+        """Map each requested id to its active user (or None), in request order."""
+        found = {u.id: u for u in self.repo.list_active_by_ids(user_ids)}
+        return {uid: found.get(uid) for uid in user_ids}
+
     def get_user_list(
         self,
         name: str | None = None,
         company_id: int | None = None,
         offset: int = 0,
         limit: int = 10,
-    ) -> list[User]:
+    ) -> Sequence[User]:
         return self.repo.list_users(name, company_id, offset, limit)
 
     def create_user(self, data: UserRegisterData) -> User:
         user = User(
             username=data.username,
-            hashed_password=get_password_hash(data.password),
+            hashed_password=_hash_password(data.password),
             phone=data.phone,
             company_id=data.company_id,
             is_admin=False,
@@ -113,7 +147,7 @@ class UserService:
 
     def authenticate_user(self, username: str, password: str) -> User:
         user = self.repo.find_by_username(username)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not _verify_password(password, user.hashed_password):
             raise AuthenticationError("用户名或密码错误")
         return user
 
@@ -125,4 +159,14 @@ class UserService:
             algorithm=settings.jwt_algorithm,
             expires_delta=timedelta(minutes=settings.jwt_expire_minutes),
         )
-        return UserWithToken(**UserSchema.model_validate(user).model_dump(), token=token)
+        # Fields come straight from the ORM row, so skip re-validation.
+        return UserWithToken.model_construct(
+            id=user.id,
+            username=user.username,
+            phone=user.phone,
+            company_id=user.company_id,
+            is_admin=user.is_admin,
+            is_system_admin=user.is_system_admin,
+            disabled=user.disabled,
+            token=token,
+        )
@@ -1,41 +1,27 @@
 """Test fixtures for the identity service."""
 
+import httpx
 import pytest
 from common.auth import get_password_hash
-from common.models import Base
-from fastapi.testclient import TestClient
+from common.testing import savepoint_get_db, startup_client
 from identity.app import create_app
+from identity.config import settings
 from identity.database import get_db
 from identity.models import Company, User
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
 
+# Minimum bcrypt cost keeps hashing from dominating the suite's runtime.
+TEST_BCRYPT_ROUNDS = 4
 
-@pytest.fixture
-def engine():
-    eng = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    Base.metadata.create_all(eng)
-    yield eng
-    Base.metadata.drop_all(eng)
-    eng.dispose()
 
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch):
+    monkeypatch.setattr(settings, "bcrypt_rounds", TEST_BCRYPT_ROUNDS)
 
-@pytest.fixture
-def session(engine):
-    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
-    sess = factory()
-    yield sess
-    sess.close()
 
-
-@pytest.fixture
-def seed_data(session: Session):
-    """Insert seed data for testing."""
+@pytest.fixture(scope="module")
+def seed_data(engine):
+    """Insert seed data for testing, once per module."""
     companies = [
         Company(
             id=1,
@@ -58,7 +44,7 @@ def seed_data(session: Session):
         User(
             id=1,
             username="admin",
-            hashed_password=get_password_hash("admin123"),
+            hashed_password=get_password_hash("admin123", TEST_BCRYPT_ROUNDS),
             phone="13900000001",
             company_id=1,
             is_admin=True,
@@ -68,7 +54,7 @@ def seed_data(session: Session):
         User(
             id=2,
             username="user1",
-            hashed_password=get_password_hash("user123"),
+            hashed_password=get_password_hash("user123", TEST_BCRYPT_ROUNDS),
             phone="13900000002",
             company_id=1,
             is_admin=False,
@@ -78,7 +64,7 @@ def seed_data(session: Session):
         User(
             id=3,
             username="disabled_user",
-            hashed_password=get_password_hash("pass123"),
+            hashed_password=get_password_hash("pass123", TEST_BCRYPT_ROUNDS),
             phone="13900000003",
             company_id=2,
             is_admin=False,
@@ -86,28 +72,51 @@ def seed_data(session: Session):
             disabled=True,
         ),
     ]
-    session.add_all(companies + users)
-    session.commit()
+    with Session(engine) as session:
+        session.add_all(companies + users)
+        session.commit()
+
+
+@pytest.fixture(scope="module")
+def module_client(seed_data, tmp_path_factory):
+    """One app and TestClient (and one lifespan run) per test module."""
+    with startup_client(create_app, "identity.app", tmp_path_factory.mktemp("db")) as c:
+        yield c
+
+
+@pytest.fixture
+def client(module_client, session_factory):
+    """Test client whose request sessions run in savepoints on the test's connection."""
+    overrides = module_client.app.dependency_overrides
+    overrides[get_db] = savepoint_get_db(session_factory)
+    yield module_client
+    overrides.clear()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
 
 
 @pytest.fixture
-def client(engine, seed_data):
-    """Create a test client with an in-memory database."""
-    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+async def async_client(client, connection):
+    """Async client on the same app, for issuing read requests concurrently.
+
+    Concurrent requests cannot each hold a SAVEPOINT on the shared test connection (they would
+    release each other's), so these sessions join the outer transaction without one.
+    """
+    factory = sessionmaker(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="rollback_only",
+    )
 
     def override_get_db():
-        sess = factory()
-        try:
+        with factory() as sess:
             yield sess
-            sess.commit()
-        except Exception:
-            sess.rollback()
-            raise
-        finally:
-            sess.close()
 
-    app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
-
-    with TestClient(app) as c:
-        yield c
+    client.app.dependency_overrides[get_db] = override_get_db
+    transport = httpx.ASGITransport(app=client.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
@@ -1,32 +1,30 @@
 """API tests for user endpoints."""
 
+import asyncio
 
-class TestGetUsers:
-    def test_list_all(self, client):
-        resp = client.get("/user")
-        assert resp.status_code == 200
-        body = resp.json()
-        # disabled users are excluded
-        assert len(body["data"]) == 2
+import pytest
+from common import auth
+from common.cache import TTLCache
 
-    def test_filter_by_name(self, client):
-        resp = client.get("/user", params={"name": "admin"})
-        assert resp.status_code == 200
-        assert len(resp.json()["data"]) == 1
-        assert resp.json()["data"][0]["username"] == "admin"
 
-    def test_filter_by_company(self, client):
-        resp = client.get("/user", params={"company_id": 1})
-        assert resp.status_code == 200
-        assert len(resp.json()["data"]) == 2
-
-    def test_pagination(self, client):
-        resp = client.get("/user", params={"offset": 0, "limit": 1})
-        assert resp.status_code == 200
-        assert len(resp.json()["data"]) == 1
+@pytest.mark.anyio
+class TestGetUsers:
+    async def test_list_queries(self, async_client):
+        all_users, by_name, by_company, page = await asyncio.gather(
+            async_client.get("/user"),
+            async_client.get("/user", params={"name": "admin"}),
+            async_client.get("/user", params={"company_id": 1}),
+            async_client.get("/user", params={"offset": 0, "limit": 1}),
+        )
+        assert [r.status_code for r in (all_users, by_name, by_company, page)] == [200] * 4
+        # disabled users are excluded
+        assert len(all_users.json()["data"]) == 2
+        assert [u["username"] for u in by_name.json()["data"]] == ["admin"]
+        assert len(by_company.json()["data"]) == 2
+        assert len(page.json()["data"]) == 1
 
-    def test_user_fields(self, client):
-        resp = client.get("/user")
+    async def test_user_fields(self, async_client):
+        resp = await async_client.get("/user")
         item = resp.json()["data"][0]
         assert "hashed_password" not in item
         assert set(item.keys()) == {
@@ -83,6 +81,24 @@ class TestLogin:
         )
         assert resp.status_code == 401
 
+    def test_repeat_login_reuses_verification(self, client, monkeypatch):
+        calls = []
+        verify = auth.verify_password
+
+        def counting_verify(plain, hashed):
+            calls.append(plain)
+            return verify(plain, hashed)
+
+        monkeypatch.setattr(auth, "_verify_cache", TTLCache(60.0, 16))
+        monkeypatch.setattr(auth, "verify_password", counting_verify)
+        creds = {"username": "admin", "password": "admin123"}
+        assert client.post("/user/login", json=creds).status_code == 200
+        assert client.post("/user/login", json=creds).status_code == 200
+        wrong = {"username": "admin", "password": "wrong"}
+        assert client.post("/user/login", json=wrong).status_code == 401
+        assert client.post("/user/login", json=wrong).status_code == 401
+        assert calls == ["admin123", "wrong", "wrong"]
+
     def test_login_nonexistent_user(self, client):
         resp = client.post(
             "/user/login",
@@ -109,6 +125,67 @@ class TestGetUser:
         assert resp.status_code == 404
 
 
+class TestBatchUsers:
+    def test_preserves_request_order(self, client):
+        resp = client.post("/user/batch", json=[2, 1])
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert list(data) == ["2", "1"]
+        assert data["1"]["username"] == "admin"
+
+    def test_disabled_and_missing_are_null(self, client):
+        resp = client.post("/user/batch", json=[1, 3, 999])
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert data["1"]["username"] == "admin"
+        assert data["3"] is None
+        assert data["999"] is None
+
+    def test_rejects_more_than_100_ids(self, client):
+        resp = client.post("/user/batch", json=list(range(101)))
+        assert resp.status_code == 422
+
+
+class TestIntrospectBatch:
+    def _token(self, client):
+        resp = client.post("/user/login", json={"username": "admin", "password": "admin123"})
+        return resp.json()["data"]["token"]
+
+    def test_requires_token(self, client):
+        resp = client.post("/user/introspect-batch", json=[1])
+        assert resp.status_code == 401
+
+    def test_invalid_token(self, client):
+        resp = client.post(
+            "/user/introspect-batch", json=[1], headers={"Authorization": "Bearer bad"}
+        )
+        assert resp.status_code == 401
+
+    def test_bearer_token(self, client):
+        token = self._token(client)
+        resp = client.post(
+            "/user/introspect-batch",
+            json=[1, 2],
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert resp.status_code == 200
+        data = resp.json()["data"]
+        assert data["1"]["phone"] == "13900000001"
+        assert data["2"]["username"] == "user1"
+
+    def test_token_header(self, client):
+        token = self._token(client)
+        resp = client.post("/user/introspect-batch", json=[3], headers={"Token": token})
+        assert resp.status_code == 200
+        assert resp.json()["data"]["3"] is None
+
+    def test_schemes_are_documented(self, client):
+        spec = client.get("/openapi.json").json()
+        operation = spec["paths"]["/user/introspect-batch"]["post"]
+        assert operation["security"] == [{"HTTPBearer": []}, {"APIKeyHeader": []}]
+        assert spec["components"]["securitySchemes"]["APIKeyHeader"]["name"] == "Token"
+
+
 class TestUpdateUser:
     def test_update_phone(self, client):
         resp = client.put("/user/1", json={"phone": "13999999999"})
@@ -8,70 +8,126 @@ from pathlib import Path
 from common.exceptions import setup_exception_handlers
 from common.logging import setup_logging
 from common.models import Base
+from common.responses import FastORJSONResponse
 from common.schemas import ResponseModel
 from fastapi import FastAPI, Request
-from sqlalchemy import text
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse
+from sqlalchemy import Connection, inspect, text
 
 from meta.config import settings
 from meta.database import engine
-from meta.router import router
+from meta.router import clear_response_cache, router
 
 logger = logging.getLogger(__name__)
 
 _SEED_SQL = Path(__file__).parent / "seed.sql"
+# Read and split once per process; reused by every lifespan startup and test module.
+_SEED_SCRIPT = _SEED_SQL.read_text()
+_SEED_STATEMENTS: tuple[str, ...] = tuple(
+    stmt.strip() for stmt in _SEED_SCRIPT.split(";") if stmt.strip()
+)
+
+# Health checks and browser noise are not worth a log line per request.
+_SKIP_PATHS = frozenset({"/", "/favicon.ico"})
+
+
+def seed_reference_data(conn: Connection) -> None:
+    """Load seed.sql in a single transaction on the given connection."""
+    if conn.dialect.name == "sqlite":
+        # One driver call for the whole script instead of a round-trip per statement.
+        # executescript commits any pending transaction first, so the script opens its own.
+        conn.connection.executescript(f"BEGIN;\n{_SEED_SCRIPT}\nCOMMIT;")
+        return
+    for stmt in _SEED_STATEMENTS:
+        conn.execute(text(stmt))
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     setup_logging("meta", settings.log_level)
-    Base.metadata.create_all(bind=engine)
-    with engine.connect() as conn:
-        if not conn.execute(text("SELECT 1 FROM fuel_type LIMIT 1")).first():
-            for stmt in _SEED_SQL.read_text().split(";"):
-                if stmt.strip():
-                    conn.execute(text(stmt.strip()))
-        conn.commit()
+    with engine.begin() as conn:
+        # fuel_type doubles as the sentinel table: when it exists the schema is in place and
+        # the per-table CREATE TABLE checks of create_all are skipped.
+        if not inspect(conn).has_table("fuel_type"):
+            Base.metadata.create_all(bind=conn)
+            seed_reference_data(conn)
+        elif not conn.execute(text("SELECT 1 FROM fuel_type LIMIT 1")).first():
+            seed_reference_data(conn)
+    clear_response_cache()
     logger.info("meta service started")
     yield
     logger.info("meta service stopped")
 
 
+def _install_profiler(application: FastAPI) -> None:
+    """Debug only: ``?profile=1`` returns a pyinstrument HTML report instead of the response.
+
+    pyinstrument is a dev dependency, so it is imported lazily and skipped when missing.
+    """
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        logger.warning("debug is enabled but pyinstrument is not installed; profiling is off")
+        return
+
+    @application.middleware("http")
+    async def profile_request(request: Request, call_next):
+        if request.query_params.get("profile") != "1":
+            return await call_next(request)
+        # A fresh async-mode profiler per request keeps concurrent requests from sharing one.
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        profiler.start()
+        await call_next(request)
+        profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+
 def create_app() -> FastAPI:
     application = FastAPI(
         title="元数据服务",
         description="船舶能效分析平台 - 元数据微服务（燃料类型、船舶类型、时区等）",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=FastORJSONResponse,
     )
 
     setup_exception_handlers(application)
+    # List payloads are repetitive JSON that compresses several-fold; tiny bodies are
+    # not worth the CPU.
+    application.add_middleware(GZipMiddleware, minimum_size=512)
     logging.getLogger("uvicorn.access").disabled = True
 
     @application.middleware("http")
     async def log_requests(request: Request, call_next):
-        start = time.monotonic()
+        start = time.perf_counter_ns()
         response = await call_next(request)
-        if request.method == "GET" and request.url.path == "/" and response.status_code == 200:
+        # Read the raw scope path rather than request.url, which builds a URL object.
+        path = request.scope["path"]
+        if path in _SKIP_PATHS or not logger.isEnabledFor(logging.INFO):
             return response
-        duration_ms = round((time.monotonic() - start) * 1000)
+        duration_ms = (time.perf_counter_ns() - start) // 1_000_000
         logger.info(
             "%s %s %s",
             request.method,
-            request.url.path,
+            path,
             response.status_code,
             extra={
                 "method": request.method,
-                "path": request.url.path,
+                "path": path,
                 "status_code": response.status_code,
                 "duration_ms": duration_ms,
             },
         )
         return response
 
+    if settings.debug:
+        _install_profiler(application)
+
     application.include_router(router)
 
     @application.get("/", tags=["健康检查"])
-    def health_check() -> ResponseModel:
+    async def health_check() -> ResponseModel:
         return ResponseModel(data={"service": "meta", "version": "0.1.0"}, message="ok")
 
     return application
@@ -3,7 +3,7 @@
 from collections.abc import Generator
 
 from common.database import create_engine_from_url, create_session_factory
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from meta.config import settings
 
@@ -22,3 +22,12 @@ def get_db() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+async def get_session_factory() -> sessionmaker[Session]:
+    """FastAPI dependency returning the session factory.
+
+    Declared async so that resolving it does not hop to the threadpool; handlers that
+    usually answer from memory only open a session (in a worker thread) when needed.
+    """
+    return SessionLocal
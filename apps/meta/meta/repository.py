@@ -1,6 +1,8 @@
 """Data access layer for the meta service."""
 
-from sqlalchemy import select
+from collections.abc import Sequence
+
+from sqlalchemy import Row, select
 from sqlalchemy.orm import Session
 
 from meta.models import FuelType, ShipType, TimeZone
@@ -12,11 +14,24 @@ class MetaRepository:
     def __init__(self, session: Session):
         self.session = session
 
-    def get_all_fuel_types(self) -> list[FuelType]:
-        return list(self.session.scalars(select(FuelType)).all())
-
-    def get_all_ship_types(self) -> list[ShipType]:
-        return list(self.session.scalars(select(ShipType)).all())
-
-    def get_all_time_zones(self) -> list[TimeZone]:
-        return list(self.session.scalars(select(TimeZone)).all())
+    # Reference data is only read to build response schemas, so select plain column rows and
+    # skip ORM entity hydration and identity-map bookkeeping.
+    def get_all_fuel_types(self) -> Sequence[Row]:
+        stmt = select(
+            FuelType.id, FuelType.name_cn, FuelType.name_en, FuelType.name_abbr, FuelType.cf
+        )
+        return self.session.execute(stmt).all()
+
+    def get_all_ship_types(self) -> Sequence[Row]:
+        stmt = select(
+            ShipType.id,
+            ShipType.name_cn,
+            ShipType.name_en,
+            ShipType.code,
+            ShipType.cii_related_tone,
+        )
+        return self.session.execute(stmt).all()
+
+    def get_all_time_zones(self) -> Sequence[Row]:
+        stmt = select(TimeZone.id, TimeZone.name_cn, TimeZone.name_en, TimeZone.explaination)
+        return self.session.execute(stmt).all()
@@ -1,10 +1,16 @@
 """API routes for the meta service."""
 
+import hashlib
+from collections.abc import Callable
+
+import orjson
 from common.schemas import ResponseModel
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
 
-from meta.database import get_db
+from meta.database import get_session_factory
 from meta.repository import MetaRepository
 from meta.schemas import (
     AttributeMapping,
@@ -18,78 +24,142 @@ from meta.service import MetaService
 
 router = APIRouter(prefix="/meta", tags=["元数据"])
 
+# Meta data only changes with a deploy or re-seed, so clients may keep it for a day and
+# revalidate with If-None-Match.
+_CACHE_CONTROL = "public, max-age=86400"
+
+# Serialized bodies (with their ETags) of the reference-data endpoints, built on first
+# request. The data only changes when the lifespan re-seeds, which calls
+# clear_response_cache().
+_response_cache: dict[str, tuple[bytes, str]] = {}
+
+
+def clear_response_cache() -> None:
+    """Drop the cached response bodies."""
+    _response_cache.clear()
+
+
+def _encode(items: list[BaseModel], message: str) -> tuple[bytes, str]:
+    data = [item.model_dump() for item in items]
+    body = orjson.dumps({"code": 200, "data": data, "message": message})
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison per RFC 9110: any listed tag (``W/`` ignored) or ``*`` matches."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _conditional_response(request: Request, cached: tuple[bytes, str]) -> Response:
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _load(
+    factory: sessionmaker[Session], load: Callable[[MetaService], list[BaseModel]]
+) -> list[BaseModel]:
+    with factory() as session:
+        return load(MetaService(MetaRepository(session)))
+
+
+async def _cached_response(
+    request: Request,
+    key: str,
+    message: str,
+    factory: sessionmaker[Session],
+    load: Callable[[MetaService], list[BaseModel]],
+) -> Response:
+    cached = _response_cache.get(key)
+    if cached is None:
+        # Only a cache miss touches the database; that blocking work runs in the threadpool.
+        items = await run_in_threadpool(_load, factory, load)
+        cached = _response_cache[key] = _encode(items, message)
+    return _conditional_response(request, cached)
+
 
-def get_meta_service(session: Session = Depends(get_db)) -> MetaService:
-    return MetaService(MetaRepository(session))
+# The static lists only change with a deploy, so their bodies are encoded once at import.
+_ATTRIBUTES = _encode(MetaService.get_attributes(), "获取属性成功")
+_ATTRIBUTE_MAPPING = _encode(MetaService.get_attribute_mapping(), "获取属性组合成功")
+_FUEL_TYPE_CATEGORIES = _encode(MetaService.get_fuel_type_categories(), "获取燃料类型成功")
 
 
 @router.get(
     "/fuel_type",
     summary="获取燃料类型",
     description="返回系统支持的所有燃料类型，包含中英文名称、缩写及碳排放因子（CF）。",
+    response_model=ResponseModel[list[FuelTypeSchema]],
 )
-def get_fuel_types(
-    service: MetaService = Depends(get_meta_service),
-) -> ResponseModel[list[FuelTypeSchema]]:
-    types = service.get_all_fuel_types()
-    data = [FuelTypeSchema.model_validate(t) for t in types]
-    return ResponseModel(data=data, message="获取燃料类型成功")
+async def get_fuel_types(
+    request: Request,
+    factory: sessionmaker[Session] = Depends(get_session_factory),
+) -> Response:
+    return await _cached_response(
+        request, "fuel_type", "获取燃料类型成功", factory, MetaService.get_all_fuel_types
+    )
 
 
 @router.get(
     "/ship_type",
     summary="获取船舶类型",
     description="返回 IMO CII 规定的船舶类型列表，包含类型代码及 CII 计算吨位基准（DWT 或 GT）。",
+    response_model=ResponseModel[list[ShipTypeSchema]],
 )
-def get_ship_types(
-    service: MetaService = Depends(get_meta_service),
-) -> ResponseModel[list[ShipTypeSchema]]:
-    types = service.get_all_ship_types()
-    data = [ShipTypeSchema.model_validate(t) for t in types]
-    return ResponseModel(data=data, message="获取船舶类型成功")
+async def get_ship_types(
+    request: Request,
+    factory: sessionmaker[Session] = Depends(get_session_factory),
+) -> Response:
+    return await _cached_response(
+        request, "ship_type", "获取船舶类型成功", factory, MetaService.get_all_ship_types
+    )
 
 
 @router.get(
     "/time_zone",
     summary="获取时区",
     description="返回全球 25 个标准时区（UTC-12 至 UTC+12），供航海日志时区选择使用。",
+    response_model=ResponseModel[list[TimeZoneSchema]],
 )
-def get_time_zones(
-    service: MetaService = Depends(get_meta_service),
-) -> ResponseModel[list[TimeZoneSchema]]:
-    types = service.get_all_time_zones()
-    data = [TimeZoneSchema.model_validate(t) for t in types]
-    return ResponseModel(data=data, message="获取时区成功")
+async def get_time_zones(
+    request: Request,
+    factory: sessionmaker[Session] = Depends(get_session_factory),
+) -> Response:
+    return await _cached_response(
+        request, "time_zone", "获取时区成功", factory, MetaService.get_all_time_zones
+    )
 
 
 @router.get(
     "/attributes",
     summary="属性",
     description="返回性能分析支持的船舶属性列表（如航速、主机功率、油耗等），每个属性含字段名与中文描述。",
+    response_model=ResponseModel[list[AttributeMapping]],
 )
-def get_attributes(
-    service: MetaService = Depends(get_meta_service),
-) -> ResponseModel[list[AttributeMapping]]:
-    return ResponseModel(data=service.get_attributes(), message="获取属性成功")
+async def get_attributes(request: Request) -> Response:
+    return _conditional_response(request, _ATTRIBUTES)
 
 
 @router.get(
     "/attribute_mapping",
     summary="属性组合",
     description="返回用于散点图分析的属性对组合（X 轴 / Y 轴），例如对水航速 vs 主机功率。",
+    response_model=ResponseModel[list[AttributeMappings]],
 )
-def get_attribute_mapping(
-    service: MetaService = Depends(get_meta_service),
-) -> ResponseModel[list[AttributeMappings]]:
-    return ResponseModel(data=service.get_attribute_mapping(), message="获取属性组合成功")
+async def get_attribute_mapping(request: Request) -> Response:
+    return _conditional_response(request, _ATTRIBUTE_MAPPING)
 
 
 @router.get(
     "/fuel_type_category",
     summary="燃料类型分类",
     description="返回燃料大类列表（如 hfo、lng、hydrogen），用于前端筛选和分组展示。",
+    response_model=ResponseModel[list[LabelValue]],
 )
-def get_fuel_type_category(
-    service: MetaService = Depends(get_meta_service),
-) -> ResponseModel[list[LabelValue]]:
-    return ResponseModel(data=service.get_fuel_type_categories(), message="获取燃料类型成功")
+async def get_fuel_type_category(request: Request) -> Response:
+    return _conditional_response(request, _FUEL_TYPE_CATEGORIES)
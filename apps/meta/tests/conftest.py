@@ -1,60 +1,33 @@
 """Test fixtures for the meta service."""
 
-from pathlib import Path
-
 import pytest
-from common.models import Base
-from fastapi.testclient import TestClient
-from meta.app import create_app
-from meta.database import get_db
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-
-_SEED_SQL = Path(__file__).parent.parent / "meta" / "seed.sql"
-
-
-@pytest.fixture
-def engine():
-    eng = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    Base.metadata.create_all(eng)
-    yield eng
-    Base.metadata.drop_all(eng)
-    eng.dispose()
+from common.testing import savepoint_get_db, startup_client
+from meta.app import create_app, seed_reference_data
+from meta.database import get_db, get_session_factory
+from meta.router import clear_response_cache
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def seed_data(engine):
-    """Seed reference data by executing the same SQL file used in production."""
-    with engine.connect() as conn:
-        for stmt in _SEED_SQL.read_text().split(";"):
-            if stmt.strip():
-                conn.execute(text(stmt.strip()))
-        conn.commit()
+    """Seed reference data once per module with the same SQL file used in production."""
+    with engine.begin() as conn:
+        seed_reference_data(conn)
 
 
-@pytest.fixture
-def client(engine, seed_data):
-    """Create a test client with an in-memory database."""
-    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
-
-    def override_get_db():
-        sess = factory()
-        try:
-            yield sess
-            sess.commit()
-        except Exception:
-            sess.rollback()
-            raise
-        finally:
-            sess.close()
+@pytest.fixture(scope="module")
+def module_client(seed_data, tmp_path_factory):
+    """One app and TestClient (and one lifespan run) per test module."""
+    with startup_client(create_app, "meta.app", tmp_path_factory.mktemp("db")) as c:
+        yield c
 
-    app = create_app()
-    app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as c:
-        yield c
+@pytest.fixture
+def client(module_client, session_factory):
+    """Test client whose request sessions run in savepoints on the test's connection."""
+    overrides = module_client.app.dependency_overrides
+    overrides[get_db] = savepoint_get_db(session_factory)
+    overrides[get_session_factory] = lambda: session_factory
+    yield module_client
+    overrides.clear()
+    # The response cache outlives a test; drop bodies built from rolled-back data.
+    clear_response_cache()
@@ -1,5 +1,10 @@
 """API tests for all meta service endpoints."""
 
+from fastapi.testclient import TestClient
+from meta.app import create_app
+from meta.config import settings
+from sqlalchemy import text
+
 
 class TestHealthCheck:
     def test_root(self, client):
@@ -143,3 +148,78 @@ class TestFuelTypeCategory:
         resp = client.get("/meta/fuel_type_category")
         item = resp.json()["data"][0]
         assert set(item.keys()) == {"label", "value"}
+
+
+class TestReferenceCache:
+    def test_repeat_requests_are_served_from_cache(self, client, connection):
+        first = client.get("/meta/fuel_type")
+        connection.execute(text("DELETE FROM fuel_type"))
+        second = client.get("/meta/fuel_type")
+        assert second.status_code == 200
+        assert second.headers["content-type"] == "application/json"
+        assert second.content == first.content
+
+    def test_cache_is_rebuilt_on_startup(self, client, connection):
+        client.get("/meta/time_zone")
+        connection.execute(text("DELETE FROM time_zone WHERE id > 1"))
+        with TestClient(client.app) as restarted:
+            resp = restarted.get("/meta/time_zone")
+        assert len(resp.json()["data"]) == 1
+
+
+class TestConditionalGet:
+    def test_etag_and_cache_control(self, client):
+        resp = client.get("/meta/ship_type")
+        assert resp.headers["etag"].startswith('"')
+        assert resp.headers["cache-control"] == "public, max-age=86400"
+
+    def test_matching_etag_returns_304(self, client):
+        etag = client.get("/meta/fuel_type").headers["etag"]
+        resp = client.get("/meta/fuel_type", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
+
+    def test_static_endpoint_returns_304(self, client):
+        etag = client.get("/meta/attributes").headers["etag"]
+        resp = client.get("/meta/attributes", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+    def test_etag_list_and_weak_tags_match(self, client):
+        etag = client.get("/meta/ship_type").headers["etag"]
+        resp = client.get("/meta/ship_type", headers={"If-None-Match": f'"other", W/{etag}'})
+        assert resp.status_code == 304
+
+    def test_wildcard_returns_304(self, client):
+        resp = client.get("/meta/fuel_type_category", headers={"If-None-Match": "*"})
+        assert resp.status_code == 304
+
+    def test_stale_etag_returns_body(self, client):
+        resp = client.get("/meta/time_zone", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert len(resp.json()["data"]) == 25
+
+
+class TestCompression:
+    def test_large_list_is_gzipped(self, client):
+        resp = client.get("/meta/time_zone", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert len(resp.json()["data"]) == 25
+
+    def test_small_body_is_not_compressed(self, client):
+        resp = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+
+
+class TestProfiler:
+    def test_profile_report_in_debug(self, monkeypatch):
+        monkeypatch.setattr(settings, "debug", True)
+        with TestClient(create_app()) as c:
+            resp = c.get("/meta/attributes", params={"profile": "1"})
+            assert resp.status_code == 200
+            assert resp.headers["content-type"].startswith("text/html")
+            assert c.get("/meta/attributes").json()["code"] == 200
+
+    def test_profile_param_ignored_without_debug(self, client):
+        resp = client.get("/meta/attributes", params={"profile": "1"})
+        assert resp.headers["content-type"] == "application/json"
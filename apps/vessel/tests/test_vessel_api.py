@@ -1,5 +1,17 @@
 """API tests for the vessel service."""
 
+import io
+import json
+import threading
+import time
+
+import ormsgpack
+from sqlalchemy import event, text
+from vessel import service as service_module
+from vessel.repository import VesselRepository
+from vessel.schemas import VesselUpdate
+from vessel.service import VesselService
+
 
 class TestHealthCheck:
     def test_root(self, client):
@@ -60,6 +72,11 @@ class TestGetVessels:
         assert resp.status_code == 200
         assert len(resp.json()["data"]) == 0
 
+    def test_filter_by_name_treats_wildcards_literally(self, client):
+        resp = client.get("/vessel", params={"name": "%"})
+        assert resp.status_code == 200
+        assert len(resp.json()["data"]) == 0
+
     def test_filter_by_company(self, client):
         resp = client.get("/vessel", params={"company_id": 1})
         assert resp.status_code == 200
@@ -75,6 +92,174 @@ class TestGetVessels:
         assert resp.status_code == 200
         assert len(resp.json()["data"]) == 0
 
+    def test_keyset_pagination(self, client):
+        for i in range(2):
+            client.post(
+                "/vessel",
+                json={
+                    "name": f"游标船{i}",
+                    "mmsi": f"50000000{i}",
+                    "ship_type": 1,
+                    "build_date": "2021-01-01",
+                    "gross_tone": 1000.0,
+                    "dead_weight": 800.0,
+                    "company_id": 1,
+                },
+            )
+        first = client.get("/vessel", params={"limit": 2}).json()
+        assert [v["id"] for v in first["data"]] == sorted(v["id"] for v in first["data"])
+        assert first["next_cursor"] == first["data"][-1]["id"]
+        rest = client.get("/vessel", params={"after_id": first["next_cursor"]}).json()
+        assert [v["name"] for v in rest["data"]] == ["游标船1"]
+        assert rest["next_cursor"] is None
+
+    def test_list_query_count_is_independent_of_page_size(self, client, engine):
+        for i in range(3):
+            client.post(
+                "/vessel",
+                json={
+                    "name": f"批量船{i}",
+                    "mmsi": f"40000000{i}",
+                    "ship_type": 1,
+                    "build_date": "2021-01-01",
+                    "gross_tone": 1000.0,
+                    "dead_weight": 800.0,
+                    "company_id": 1,
+                    "equipments": [{"name": "主机", "type": "me", "fuel_type_ids": [1, 2]}],
+                    "curves": [
+                        {
+                            "curve_name": "满载",
+                            "draft_astern": 8.0,
+                            "draft_bow": 8.0,
+                            "curve_data": [{"speed_water": 10.0, "me_power": 3000.0}],
+                        }
+                    ],
+                },
+            )
+        selects = []
+
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            resp = client.get("/vessel")
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        assert len(resp.json()["data"]) == 4
+        # vessels + equipments + fuel entries + curves + curve data
+        assert len(selects) == 5
+
+
+class TestMsgpack:
+    def test_msgpack_when_accepted(self, client):
+        resp = client.get("/vessel", headers={"Accept": "application/x-msgpack"})
+        assert resp.headers["content-type"] == "application/x-msgpack"
+        assert "Accept" in resp.headers["vary"].split(", ")
+        body = ormsgpack.unpackb(resp.content)
+        assert body == client.get("/vessel").json()
+
+    def test_refused_msgpack_gets_json(self, client):
+        resp = client.get("/vessel", headers={"Accept": "application/x-msgpack;q=0, */*"})
+        assert resp.headers["content-type"] == "application/json"
+
+    def test_preferred_json_wins(self, client):
+        accept = "application/json, application/x-msgpack;q=0.5"
+        resp = client.get("/vessel", headers={"Accept": accept})
+        assert resp.headers["content-type"] == "application/json"
+        accept = "application/json;q=0.5, application/x-msgpack"
+        resp = client.get("/vessel", headers={"Accept": accept})
+        assert resp.headers["content-type"] == "application/x-msgpack"
+
+    def test_json_by_default(self, client):
+        resp = client.get("/vessel", headers={"Accept": "application/json"})
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json()["data"][0]["name"] == "测试船舶"
+
+
+class TestCompression:
+    def test_list_is_gzipped(self, client):
+        resp = client.get("/vessel", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.json()["data"][0]["name"] == "测试船舶"
+
+
+class TestListCache:
+    def test_repeat_list_is_served_from_cache(self, client, session):
+        first = client.get("/vessel")
+        session.execute(text("UPDATE vessel SET name = '改名船舶'"))
+        session.commit()
+        second = client.get("/vessel")
+        assert second.content == first.content
+        assert client.get("/vessel", params={"limit": 5}).json()["data"][0]["name"] == "改名船舶"
+
+    def test_write_clears_cache(self, client):
+        client.get("/vessel")
+        client.put("/vessel/1", json={"name": "更新后船名"})
+        assert client.get("/vessel").json()["data"][0]["name"] == "更新后船名"
+
+    def test_cache_is_cleared_when_the_write_commits(self, client, session):
+        client.get("/vessel")
+        service = VesselService(VesselRepository(session))
+        service.update_vessel(1, VesselUpdate(name="提交后船名"))
+        assert service_module._list_cache
+        session.commit()
+        assert not service_module._list_cache
+
+    def test_cache_expires(self, client, session, monkeypatch):
+        client.get("/vessel")
+        session.execute(text("UPDATE vessel SET name = '过期船舶'"))
+        session.commit()
+        monkeypatch.setattr(service_module._list_cache, "ttl", 0.0)
+        service_module.clear_list_cache()
+        client.get("/vessel")
+        assert client.get("/vessel").json()["data"][0]["name"] == "过期船舶"
+
+
+class TestAnalyticsMetrics:
+    def test_lookups_run_concurrently(self, client, monkeypatch):
+        # Both lookups must be in flight together to pass the barrier; a sequential fetch
+        # would time out and fall back to the defaults.
+        barrier = threading.Barrier(2, timeout=2)
+        bodies = {
+            "average": {"data": {"speed_water": 12.5, "me_fuel_consumption_nmile": 0.3}},
+            "cii": {"data": [{"cii": 5.1, "rating": "B"}, {"cii": 4.2, "rating": "A"}]},
+        }
+
+        def fake_urlopen(url, timeout):
+            barrier.wait()
+            return io.BytesIO(json.dumps(bodies[url.rsplit("/", 1)[-1]]).encode())
+
+        monkeypatch.setattr(service_module, "urlopen", fake_urlopen)
+        vessel = client.get("/vessel/1").json()["data"]
+        assert vessel["speed_water"] == 12.5
+        assert vessel["me_fuel_consumption_nmile"] == 0.3
+        assert vessel["latest_cii"] == 4.2
+        assert vessel["cii_rating"] == "A"
+
+    def test_one_call_keeps_a_batch_in_flight(self, session, monkeypatch):
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_urlopen(url, timeout):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            raise OSError("analytics down")
+
+        monkeypatch.setattr(service_module, "urlopen", fake_urlopen)
+        metrics = VesselService(VesselRepository(session))._get_analytics_metrics(list(range(20)))
+        assert len(metrics) == 20
+        assert peak <= 2 * service_module._METRICS_BATCH
+
+    def test_limit_is_bounded(self, client):
+        assert client.get("/vessel", params={"limit": 1001}).status_code == 422
+
 
 class TestCreateVessel:
     def test_create_basic(self, client):
@@ -92,6 +277,7 @@ class TestCreateVessel:
         data = resp.json()["data"]
         assert data["name"] == "新船舶"
         assert data["mmsi"] == "987654321"
+        assert data["created_at"] is not None
         assert data["equipments"] == []
         assert data["curves"] == []
 
@@ -126,6 +312,8 @@ class TestCreateVessel:
         assert len(data["equipments"]) == 2
         assert len(data["curves"]) == 1
         assert len(data["curves"][0]["curve_data"]) == 2
+        fuel_ids = {e["name"]: sorted(e["fuel_type_ids"]) for e in data["equipments"]}
+        assert fuel_ids == {"主机": [1, 3], "锅炉": [1]}
 
 
 class TestGetVessel:
@@ -161,6 +349,36 @@ class TestUpdateVessel:
         assert len(equipments) == 1
         assert equipments[0]["name"] == "新主机"
 
+    def test_update_leaves_no_orphan_rows(self, client, session):
+        client.put(
+            "/vessel/1", json={"equipments": [{"name": "新主机", "type": "me"}], "curves": []}
+        )
+        counts = {
+            table: session.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+            for table in ("equipment", "equipment_fuel", "power_speed_curve", "curve_data")
+        }
+        assert counts == {
+            "equipment": 1,
+            "equipment_fuel": 0,
+            "power_speed_curve": 0,
+            "curve_data": 0,
+        }
+
+    def test_omitted_children_are_kept(self, client):
+        resp = client.put("/vessel/1", json={"name": "只改船名"})
+        data = resp.json()["data"]
+        assert len(data["equipments"]) == 2
+        assert len(data["curves"]) == 1
+        resp = client.put("/vessel/1", json={"curves": []})
+        data = resp.json()["data"]
+        assert len(data["equipments"]) == 2
+        assert data["curves"] == []
+
+    def test_empty_update_changes_nothing(self, client):
+        resp = client.put("/vessel/1", json={})
+        assert resp.status_code == 200
+        assert resp.json()["data"]["name"] == "测试船舶"
+
     def test_update_not_found(self, client):
         resp = client.put("/vessel/999", json={"name": "不存在"})
         assert resp.status_code == 404
@@ -8,13 +8,16 @@ from pathlib import Path
 from common.exceptions import setup_exception_handlers
 from common.logging import setup_logging
 from common.models import Base
+from common.responses import FastORJSONResponse
 from common.schemas import ResponseModel
 from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy import text
 
 from vessel.config import settings
 from vessel.database import engine
 from vessel.router import vessel_router
+from vessel.service import clear_list_cache
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,7 @@ async def lifespan(_app: FastAPI):
                 if stmt.strip():
                     conn.execute(text(stmt.strip()))
         conn.commit()
+    clear_list_cache()
     logger.info("vessel service started")
     yield
     logger.info("vessel service stopped")
@@ -42,9 +46,13 @@ def create_app() -> FastAPI:
         description="船舶能效分析平台 - 船舶信息与设备管理微服务",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=FastORJSONResponse,
     )
 
     setup_exception_handlers(application)
+    # List payloads are repetitive JSON that compresses several-fold; tiny bodies are
+    # not worth the CPU.
+    application.add_middleware(GZipMiddleware, minimum_size=512)
     logging.getLogger("uvicorn.access").disabled = True
 
     @application.middleware("http")
@@ -9,6 +9,9 @@ _DATA_DIR = Path(__file__).resolve().parents[3] / "data"
 
 class Settings(BaseSettings):
     database_url: str = f"sqlite:///{(_DATA_DIR / 'vessel.db').as_posix()}"
+    # Pool sizing for server databases; SQLite uses the dialect's default pool.
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
     log_level: str = "INFO"
     analytics_service_url: str = "http://localhost:9005"
     analytics_timeout_seconds: int = 3
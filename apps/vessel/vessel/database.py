@@ -1,16 +1,45 @@
 """Database engine and session dependency for the vessel service."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from vessel.config import settings
 
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False},
+# Applied to every new SQLite connection: WAL lets readers run alongside the writer,
+# NORMAL sync skips the fsync per commit that WAL makes unnecessary, and a 64 MiB page
+# cache keeps the working set in memory.
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
 )
 
-_SessionFactory = sessionmaker(bind=engine, autoflush=True, expire_on_commit=False)
+if settings.database_url.startswith("sqlite"):
+    # The default QueuePool keeps file connections open across requests. StaticPool would
+    # share one sqlite3 connection (and its transaction) between worker threads.
+    engine = create_engine(settings.database_url, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+else:
+    engine = create_engine(
+        settings.database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+    )
+
+# Reads never leave pending changes, so autoflush would only scan the identity map before
+# every query; the write paths in VesselService flush explicitly.
+_SessionFactory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
 def get_db():
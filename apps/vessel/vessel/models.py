@@ -3,7 +3,8 @@
 from datetime import date
 
 from common.models import Base, IntIDMixin, TimestampMixin
-from sqlalchemy import Date, Float, ForeignKey, Integer, String
+from sqlalchemy import DDL, Date, Float, ForeignKey, Index, Integer, String, event
+from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -24,7 +25,7 @@ class Vessel(IntIDMixin, TimestampMixin, Base):
     propeller_polish_date: Mapped[date | None] = mapped_column(Date, nullable=True)
 
     # Cross-service references – stored as plain integers, no FK constraint
-    company_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    company_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     ship_type: Mapped[int] = mapped_column(Integer, nullable=False)
     time_zone: Mapped[int] = mapped_column(Integer, default=1)
 
@@ -36,6 +37,22 @@ class Vessel(IntIDMixin, TimestampMixin, Base):
     )
 
 
+# Vessel search matches ``name LIKE '%x%'``, which no B-tree index can serve. On PostgreSQL a
+# trigram GIN index covers it; other dialects (SQLite) keep the sequential scan.
+Index(
+    "ix_vessel_name_trgm",
+    Vessel.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+event.listen(
+    Vessel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class Equipment(IntIDMixin, Base):
     __tablename__ = "equipment"
 
@@ -44,9 +61,13 @@ class Equipment(IntIDMixin, Base):
     vessel_id: Mapped[int] = mapped_column(ForeignKey("vessel.id"), nullable=False)
 
     vessel: Mapped["Vessel"] = relationship(back_populates="equipments")
+    # Every equipment is serialized with its fuel ids, so load them together with the
+    # equipment (one IN query per batch) on every path, including refreshes.
     fuel_entries: Mapped[list["EquipmentFuel"]] = relationship(
-        back_populates="equipment", cascade="all, delete-orphan"
+        back_populates="equipment", cascade="all, delete-orphan", lazy="selectin"
     )
+    # Plain fuel type ids, read by EquipmentSchema.fuel_type_ids.
+    fuel_type_ids: AssociationProxy[list[int]] = association_proxy("fuel_entries", "fuel_type_id")
 
 
 class EquipmentFuel(Base):
@@ -1,27 +1,64 @@
 """Data access layer for the vessel service."""
 
+from collections.abc import Sequence
+
 from common.repository import BaseRepository
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session, defer, selectinload
+
+from vessel.models import CurveData, Equipment, EquipmentFuel, PowerSpeedCurve, Vessel
 
-from vessel.models import Vessel
+# Every vessel response includes equipment (with fuel ids) and curves (with data points).
+# Loading each collection with one IN query per level keeps a page at five queries instead
+# of lazy-loading per vessel. Equipment.fuel_entries is selectin-loaded by the mapping.
+# updated_at is the one vessel column no response reads, so it is left out of the row.
+_VESSEL_GRAPH = (
+    defer(Vessel.updated_at),
+    selectinload(Vessel.equipments),
+    selectinload(Vessel.curves).selectinload(PowerSpeedCurve.curve_data),
+)
 
 
 class VesselRepository(BaseRepository[Vessel]):
     def __init__(self, session: Session):
         super().__init__(session, Vessel)
 
+    def get_by_id(self, id: int) -> Vessel | None:
+        return self.session.get(Vessel, id, options=_VESSEL_GRAPH)
+
     def list_vessels(
         self,
         name: str | None = None,
         company_id: int | None = None,
         offset: int = 0,
         limit: int = 10,
-    ) -> list[Vessel]:
-        stmt = select(Vessel)
+        after_id: int | None = None,
+    ) -> Sequence[Vessel]:
+        stmt = select(Vessel).options(*_VESSEL_GRAPH)
+        if after_id is not None:
+            # Keyset page: seek past the cursor on the primary key instead of skipping rows.
+            stmt = stmt.where(Vessel.id > after_id)
         if name:
-            stmt = stmt.where(Vessel.name.like(f"%{name}%"))
+            # Escapes % and _ in the search text; on PostgreSQL ix_vessel_name_trgm serves it.
+            stmt = stmt.where(Vessel.name.contains(name, autoescape=True))
         if company_id is not None:
             stmt = stmt.where(Vessel.company_id == company_id)
-        stmt = stmt.offset(offset).limit(limit)
-        return list(self.session.scalars(stmt).all())
+        stmt = stmt.order_by(Vessel.id).offset(offset).limit(limit)
+        return self.session.scalars(stmt).all()
+
+    def delete_equipments(self, vessel_id: int) -> None:
+        """Delete a vessel's equipment and their fuel entries in two statements.
+
+        The foreign keys carry no ON DELETE CASCADE, so the fuel entries go first.
+        """
+        equipment_ids = select(Equipment.id).where(Equipment.vessel_id == vessel_id)
+        self.session.execute(
+            delete(EquipmentFuel).where(EquipmentFuel.equipment_id.in_(equipment_ids))
+        )
+        self.session.execute(delete(Equipment).where(Equipment.vessel_id == vessel_id))
+
+    def delete_curves(self, vessel_id: int) -> None:
+        """Delete a vessel's power-speed curves and their points in two statements."""
+        curve_ids = select(PowerSpeedCurve.id).where(PowerSpeedCurve.vessel_id == vessel_id)
+        self.session.execute(delete(CurveData).where(CurveData.power_speed_curve_id.in_(curve_ids)))
+        self.session.execute(delete(PowerSpeedCurve).where(PowerSpeedCurve.vessel_id == vessel_id))
@@ -1,31 +1,115 @@
 """API routes for the vessel service."""
 
+import orjson
+import ormsgpack
+from common.responses import FastORJSONResponse
 from common.schemas import ResponseModel
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
 
 from vessel.database import get_db
 from vessel.repository import VesselRepository
-from vessel.schemas import VesselCreate, VesselSchema, VesselUpdate
+from vessel.schemas import VesselCreate, VesselListResponse, VesselSchema, VesselUpdate
 from vessel.service import VesselService
 
 vessel_router = APIRouter(prefix="/vessel", tags=["船舶"])
 
+_JSON = "application/json"
+_MSGPACK = "application/x-msgpack"
+# Either encoding may be returned, so shared caches must key on Accept.
+_VARY = {"Vary": "Accept"}
+# A MessagePack map of four entries, written up to the data value.
+_MSGPACK_ENVELOPE_HEAD = b"\x84" + ormsgpack.packb("code") + ormsgpack.packb(200)
+_MSGPACK_ENVELOPE_HEAD += ormsgpack.packb("data")
+
+
+def _accept_qualities(accept: str) -> dict[str, float]:
+    """Media range -> q value for each entry of an Accept header."""
+    qualities = {}
+    for entry in accept.split(","):
+        media_range, *params = (part.strip() for part in entry.split(";"))
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_range:
+            qualities[media_range.lower()] = q
+    return qualities
+
+
+def get_media_type(request: Request) -> str:
+    """Content negotiation: msgpack when the client names it at least as highly as JSON.
+
+    MessagePack must be listed explicitly (wildcards select JSON); JSON's q is taken from
+    its most specific matching range.
+    """
+    qualities = _accept_qualities(request.headers.get("accept", ""))
+    msgpack_q = qualities.get(_MSGPACK, 0.0)
+    json_q = next((qualities[r] for r in (_JSON, "application/*", "*/*") if r in qualities), 0.0)
+    return _MSGPACK if msgpack_q > 0 and msgpack_q >= json_q else _JSON
+
+
+def _json_envelope(data: bytes, message: str, next_cursor: int | None) -> bytes:
+    """Wrap an already-encoded JSON list in the VesselListResponse envelope."""
+    return (
+        b'{"code":200,"data":'
+        + data
+        + b',"message":'
+        + orjson.dumps(message)
+        + b',"next_cursor":'
+        + orjson.dumps(next_cursor)
+        + b"}"
+    )
+
+
+def _msgpack_envelope(data: bytes, message: str, next_cursor: int | None) -> bytes:
+    """Wrap an already-encoded MessagePack list in the VesselListResponse envelope."""
+    return (
+        _MSGPACK_ENVELOPE_HEAD
+        + data
+        + ormsgpack.packb("message")
+        + ormsgpack.packb(message)
+        + ormsgpack.packb("next_cursor")
+        + ormsgpack.packb(next_cursor)
+    )
+
 
 def get_vessel_service(session: Session = Depends(get_db)) -> VesselService:
     return VesselService(VesselRepository(session))
 
 
-@vessel_router.get("", summary="获取船舶列表")
+@vessel_router.get(
+    "",
+    summary="获取船舶列表",
+    description="默认返回 JSON；请求头 `Accept: application/x-msgpack` 时返回 MessagePack 编码。",
+    # Kept for the OpenAPI schema; the handler returns the response itself.
+    response_model=VesselListResponse,
+)
 def get_vessel_list(
     name: str | None = Query(None, description="船名（模糊搜索）"),
     company_id: int | None = Query(None, description="公司ID"),
-    offset: int = Query(0, description="偏移量"),
-    limit: int = Query(10, description="每页数量"),
+    offset: int = Query(0, description="偏移量（已弃用，请改用 after_id 游标）", deprecated=True),
+    limit: int = Query(10, ge=1, le=1000, description="每页数量"),
+    after_id: int | None = Query(
+        None, description="游标：只返回 ID 大于该值的船舶，取上一页响应的 next_cursor"
+    ),
+    media_type: str = Depends(get_media_type),
     service: VesselService = Depends(get_vessel_service),
-) -> ResponseModel[list[VesselSchema]]:
-    vessels = service.get_vessel_list(name, company_id, offset, limit)
-    return ResponseModel(data=vessels, message="获取船舶列表成功")
+) -> Response:
+    msgpack = media_type == _MSGPACK
+    data, next_cursor = service.get_vessel_list_encoded(
+        name, company_id, offset, limit, after_id, msgpack
+    )
+    envelope = _msgpack_envelope if msgpack else _json_envelope
+    return Response(
+        content=envelope(data, "获取船舶列表成功", next_cursor),
+        media_type=media_type,
+        headers=_VARY,
+    )
 
 
 @vessel_router.post("", summary="创建船舶")
@@ -37,13 +121,19 @@ def create_vessel(
     return ResponseModel(data=vessel, message="船舶创建成功")
 
 
-@vessel_router.get("/{vessel_id}", summary="获取船舶详情")
+@vessel_router.get(
+    "/{vessel_id}",
+    summary="获取船舶详情",
+    # Kept for the OpenAPI schema; the handler returns the response itself.
+    response_model=ResponseModel[VesselSchema],
+)
 def get_vessel(
     vessel_id: int,
     service: VesselService = Depends(get_vessel_service),
-) -> ResponseModel[VesselSchema]:
+) -> FastORJSONResponse:
     vessel = service.get_vessel_by_id(vessel_id)
-    return ResponseModel(data=vessel, message="获取船舶信息成功")
+    # The schema is built by the service already; skip re-validating it as a response model.
+    return FastORJSONResponse({"code": 200, "data": vessel, "message": "获取船舶信息成功"})
 
 
 @vessel_router.put("/{vessel_id}", summary="更新船舶信息")
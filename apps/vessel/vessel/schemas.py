@@ -2,7 +2,65 @@
 
 from datetime import date, datetime
 
-from pydantic import BaseModel
+from common.schemas import ResponseModel
+from pydantic import BaseModel, Field
+
+# ── OpenAPI examples ───────────────────────────────────────────────────────────
+# Built once and shared by the request and response schemas below.
+
+_EQUIPMENT_EXAMPLES = [
+    {"name": "主机", "type": "me", "fuel_type_ids": [1]},
+    {"name": "副机", "type": "dg", "fuel_type_ids": [1, 7]},
+    {"name": "锅炉", "type": "blr", "fuel_type_ids": [1, 7]},
+]
+
+_LADEN_POINTS = [(10.0, 2800.0), (12.0, 4500.0), (14.0, 7200.0), (15.5, 9800.0)]
+_BALLAST_POINTS = [(11.0, 2600.0), (13.0, 4200.0), (15.0, 6800.0)]
+
+
+def _curve_data_example(points: list[tuple[float, float]], with_ids: bool) -> list[dict]:
+    return [
+        {"id": i, "speed_water": speed, "me_power": power}
+        if with_ids
+        else {"speed_water": speed, "me_power": power}
+        for i, (speed, power) in enumerate(points, start=1)
+    ]
+
+
+_LADEN_CURVE_EXAMPLE = {
+    "curve_name": "满载",
+    "draft_astern": 10.5,
+    "draft_bow": 9.8,
+    "curve_data": _curve_data_example(_LADEN_POINTS, with_ids=False),
+}
+_LADEN_CURVE_SCHEMA_EXAMPLE = {
+    "id": 1,
+    **_LADEN_CURVE_EXAMPLE,
+    "curve_data": _curve_data_example(_LADEN_POINTS, with_ids=True),
+}
+_BALLAST_CURVE_EXAMPLE = {
+    "curve_name": "压载",
+    "draft_astern": 6.2,
+    "draft_bow": 5.5,
+    "curve_data": _curve_data_example(_BALLAST_POINTS, with_ids=False),
+}
+
+_VESSEL_EXAMPLE = {
+    "name": "八打雁",
+    "mmsi": "477401900",
+    "ship_type": 4,
+    "build_date": "2019-11-01",
+    "gross_tone": 26771.0,
+    "dead_weight": 35337.0,
+    "new_vessel": False,
+    "pitch": 6.058,
+    "hull_clean_date": "2023-06-15",
+    "engine_overhaul_date": "2022-03-01",
+    "newly_paint_date": "2023-06-15",
+    "propeller_polish_date": "2023-06-15",
+    "time_zone": 1,
+    "company_id": 1,
+}
 
 # ── Equipment ──────────────────────────────────────────────────────────────────
 
@@ -12,13 +70,7 @@ class EquipmentCreate(BaseModel):
     type: str  # me / dg / blr
     fuel_type_ids: list[int] = []
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"name": "主机", "type": "me", "fuel_type_ids": [1]},
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_EQUIPMENT_EXAMPLES[0]]}}
 
 
 class EquipmentSchema(BaseModel):
@@ -28,11 +80,7 @@ class EquipmentSchema(BaseModel):
 
     model_config = {
         "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {"name": "主机", "type": "me", "fuel_type_ids": [1]},
-            ]
-        },
+        "json_schema_extra": {"examples": [_EQUIPMENT_EXAMPLES[0]]},
     }
 
 
@@ -43,13 +91,7 @@ class CurveDataCreate(BaseModel):
     speed_water: float
     me_power: float
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {"speed_water": 12.0, "me_power": 4500.0},
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [{"speed_water": 12.0, "me_power": 4500.0}]}}
 
 
 class CurveDataSchema(BaseModel):
@@ -59,11 +101,7 @@ class CurveDataSchema(BaseModel):
 
     model_config = {
         "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {"id": 1, "speed_water": 12.0, "me_power": 4500.0},
-            ]
-        },
+        "json_schema_extra": {"examples": [{"id": 1, "speed_water": 12.0, "me_power": 4500.0}]},
     }
 
 
@@ -73,23 +111,7 @@ class PowerSpeedCurveCreate(BaseModel):
     draft_bow: float
     curve_data: list[CurveDataCreate] = []
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "curve_name": "满载",
-                    "draft_astern": 10.5,
-                    "draft_bow": 9.8,
-                    "curve_data": [
-                        {"speed_water": 10.0, "me_power": 2800.0},
-                        {"speed_water": 12.0, "me_power": 4500.0},
-                        {"speed_water": 14.0, "me_power": 7200.0},
-                        {"speed_water": 15.5, "me_power": 9800.0},
-                    ],
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_LADEN_CURVE_EXAMPLE]}}
 
 
 class PowerSpeedCurveSchema(BaseModel):
@@ -101,22 +123,7 @@ class PowerSpeedCurveSchema(BaseModel):
 
     model_config = {
         "from_attributes": True,
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "id": 1,
-                    "curve_name": "满载",
-                    "draft_astern": 10.5,
-                    "draft_bow": 9.8,
-                    "curve_data": [
-                        {"id": 1, "speed_water": 10.0, "me_power": 2800.0},
-                        {"id": 2, "speed_water": 12.0, "me_power": 4500.0},
-                        {"id": 3, "speed_water": 14.0, "me_power": 7200.0},
-                        {"id": 4, "speed_water": 15.5, "me_power": 9800.0},
-                    ],
-                }
-            ]
-        },
+        "json_schema_extra": {"examples": [_LADEN_CURVE_SCHEMA_EXAMPLE]},
     }
 
 
@@ -145,48 +152,9 @@ class VesselCreate(BaseModel):
         "json_schema_extra": {
             "examples": [
                 {
-                    "name": "八打雁",
-                    "mmsi": "477401900",
-                    "ship_type": 4,
-                    "build_date": "2019-11-01",
-                    "gross_tone": 26771.0,
-                    "dead_weight": 35337.0,
-                    "new_vessel": False,
-                    "pitch": 6.058,
-                    "hull_clean_date": "2023-06-15",
-                    "engine_overhaul_date": "2022-03-01",
-                    "newly_paint_date": "2023-06-15",
-                    "propeller_polish_date": "2023-06-15",
-                    "time_zone": 1,
-                    "company_id": 1,
-                    "equipments": [
-                        {"name": "主机", "type": "me", "fuel_type_ids": [1]},
-                        {"name": "副机", "type": "dg", "fuel_type_ids": [1, 7]},
-                        {"name": "锅炉", "type": "blr", "fuel_type_ids": [1, 7]},
-                    ],
-                    "curves": [
-                        {
-                            "curve_name": "满载",
-                            "draft_astern": 10.5,
-                            "draft_bow": 9.8,
-                            "curve_data": [
-                                {"speed_water": 10.0, "me_power": 2800.0},
-                                {"speed_water": 12.0, "me_power": 4500.0},
-                                {"speed_water": 14.0, "me_power": 7200.0},
-                                {"speed_water": 15.5, "me_power": 9800.0},
-                            ],
-                        },
-                        {
-                            "curve_name": "压载",
-                            "draft_astern": 6.2,
-                            "draft_bow": 5.5,
-                            "curve_data": [
-                                {"speed_water": 11.0, "me_power": 2600.0},
-                                {"speed_water": 13.0, "me_power": 4200.0},
-                                {"speed_water": 15.0, "me_power": 6800.0},
-                            ],
-                        },
-                    ],
+                    **_VESSEL_EXAMPLE,
+                    "equipments": _EQUIPMENT_EXAMPLES,
+                    "curves": [_LADEN_CURVE_EXAMPLE, _BALLAST_CURVE_EXAMPLE],
                 }
             ]
         }
@@ -208,46 +176,21 @@ class VesselUpdate(BaseModel):
     propeller_polish_date: date | None = None
     time_zone: int | None = None
     company_id: int | None = None
-    # Equipment and curves are replaced entirely when provided
-    equipments: list[EquipmentCreate] = []
-    curves: list[PowerSpeedCurveCreate] = []
+    # Equipment and curves are replaced entirely when provided and kept when omitted
+    equipments: list[EquipmentCreate] | None = None
+    curves: list[PowerSpeedCurveCreate] | None = None
 
     model_config = {
         "json_schema_extra": {
             "examples": [
                 {
-                    "name": "八打雁",
-                    "mmsi": "477401900",
-                    "ship_type": 4,
-                    "build_date": "2019-11-01",
-                    "gross_tone": 26771.0,
-                    "dead_weight": 35337.0,
-                    "new_vessel": False,
-                    "pitch": 6.058,
+                    **_VESSEL_EXAMPLE,
                     "hull_clean_date": "2024-01-10",
                     "engine_overhaul_date": "2023-09-01",
                     "newly_paint_date": "2024-01-10",
                     "propeller_polish_date": "2024-01-10",
-                    "time_zone": 1,
-                    "company_id": 1,
-                    "equipments": [
-                        {"name": "主机", "type": "me", "fuel_type_ids": [1]},
-                        {"name": "副机", "type": "dg", "fuel_type_ids": [1, 7]},
-                        {"name": "锅炉", "type": "blr", "fuel_type_ids": [1, 7]},
-                    ],
-                    "curves": [
-                        {
-                            "curve_name": "满载",
-                            "draft_astern": 10.5,
-                            "draft_bow": 9.8,
-                            "curve_data": [
-                                {"speed_water": 10.0, "me_power": 2800.0},
-                                {"speed_water": 12.0, "me_power": 4500.0},
-                                {"speed_water": 14.0, "me_power": 7200.0},
-                                {"speed_water": 15.5, "me_power": 9800.0},
-                            ],
-                        }
-                    ],
+                    "equipments": _EQUIPMENT_EXAMPLES,
+                    "curves": [_LADEN_CURVE_EXAMPLE],
                 }
             ]
         }
@@ -291,41 +234,27 @@ class VesselSchema(BaseModel):
             "examples": [
                 {
                     "id": 1,
-                    "name": "八打雁",
-                    "mmsi": "477401900",
-                    "ship_type": 4,
-                    "build_date": "2019-11-01",
-                    "gross_tone": 26771.0,
-                    "dead_weight": 35337.0,
-                    "new_vessel": False,
-                    "pitch": 6.058,
-                    "hull_clean_date": "2023-06-15",
-                    "engine_overhaul_date": "2022-03-01",
-                    "newly_paint_date": "2023-06-15",
-                    "propeller_polish_date": "2023-06-15",
-                    "time_zone": 1,
-                    "company_id": 1,
+                    **_VESSEL_EXAMPLE,
                     "created_at": "2024-01-15T08:30:00",
-                    "equipments": [
-                        {"name": "主机", "type": "me", "fuel_type_ids": [1]},
-                        {"name": "副机", "type": "dg", "fuel_type_ids": [1, 7]},
-                        {"name": "锅炉", "type": "blr", "fuel_type_ids": [1, 7]},
-                    ],
-                    "curves": [
-                        {
-                            "id": 1,
-                            "curve_name": "满载",
-                            "draft_astern": 10.5,
-                            "draft_bow": 9.8,
-                            "curve_data": [
-                                {"id": 1, "speed_water": 10.0, "me_power": 2800.0},
-                                {"id": 2, "speed_water": 12.0, "me_power": 4500.0},
-                                {"id": 3, "speed_water": 14.0, "me_power": 7200.0},
-                                {"id": 4, "speed_water": 15.5, "me_power": 9800.0},
-                            ],
-                        }
-                    ],
+                    "equipments": _EQUIPMENT_EXAMPLES,
+                    "curves": [_LADEN_CURVE_SCHEMA_EXAMPLE],
                 }
             ]
         },
     }
+
+
+class VesselListResponse(ResponseModel[list[VesselSchema]]):
+    """Vessel list envelope with the keyset cursor of the next page."""
+
+    next_cursor: int | None = Field(
+        default=None, description="下一页游标，作为 after_id 传入；没有下一页时为 null"
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "examples": [
+                {"code": 200, "data": [], "message": "获取船舶列表成功", "next_cursor": None}
+            ]
+        }
+    }
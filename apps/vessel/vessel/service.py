@@ -1,16 +1,20 @@
 """Business logic for the vessel service."""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from urllib.request import urlopen
 
+import ormsgpack
+from common.cache import TTLCache
 from common.exceptions import EntityNotFoundError
+from pydantic import TypeAdapter
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
 
 from vessel.config import settings
 from vessel.models import CurveData, Equipment, EquipmentFuel, PowerSpeedCurve, Vessel
 from vessel.repository import VesselRepository
 from vessel.schemas import (
-    CurveDataSchema,
     EquipmentCreate,
     EquipmentSchema,
     PowerSpeedCurveCreate,
@@ -20,6 +24,72 @@ from vessel.schemas import (
     VesselUpdate,
 )
 
+_EQUIPMENT_LIST_ADAPTER = TypeAdapter(list[EquipmentSchema])
+_CURVE_LIST_ADAPTER = TypeAdapter(list[PowerSpeedCurveSchema])
+_VESSEL_ADAPTER = TypeAdapter(VesselSchema)
+_VESSEL_LIST_ADAPTER = TypeAdapter(list[VesselSchema])
+
+_DEFAULT_METRICS = {
+    "speed_water": 0.0,
+    "me_fuel_consumption_nmile": 0.0,
+    "latest_cii": 0.0,
+    "cii_rating": "N/A",
+}
+
+# Encoded list pages and their next cursor, keyed by the query parameters and encoding.
+# Writes through this service clear it once they commit; the TTL bounds staleness from other
+# workers and from the analytics metrics embedded in each vessel.
+_list_cache: TTLCache[tuple, tuple[bytes, int | None]] = TTLCache(ttl=30.0, maxsize=256)
+
+# The analytics lookups are blocking HTTP calls dominated by network latency; a shared pool
+# lets them overlap without a thread per request.
+_METRICS_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="analytics")
+# Vessels whose lookups one call keeps in the pool at a time. A large page then waits its
+# turn batch by batch instead of queueing all its lookups ahead of other requests' metrics.
+_METRICS_BATCH = 4
+
+
+def _fetch_average(vessel_id: int) -> dict:
+    """Average speed and nmile consumption; empty on any failure."""
+    try:
+        avg_url = f"{settings.analytics_service_url}/optimization/vessel/{vessel_id}/average"
+        with urlopen(avg_url, timeout=settings.analytics_timeout_seconds) as response:
+            payload = json.loads(response.read().decode("utf-8"))
+            data = payload.get("data") or {}
+            return {
+                "speed_water": float(data.get("speed_water") or 0.0),
+                "me_fuel_consumption_nmile": float(data.get("me_fuel_consumption_nmile") or 0.0),
+            }
+    except Exception:
+        return {}
+
+
+def _fetch_cii(vessel_id: int) -> dict:
+    """Latest CII and rating; empty on any failure."""
+    try:
+        cii_url = f"{settings.analytics_service_url}/statistic/vessel/{vessel_id}/cii"
+        with urlopen(cii_url, timeout=settings.analytics_timeout_seconds) as response:
+            payload = json.loads(response.read().decode("utf-8"))
+            items = payload.get("data") or []
+            if not items:
+                return {}
+            latest = items[-1]
+            return {
+                "latest_cii": float(latest.get("cii") or 0.0),
+                "cii_rating": latest.get("rating") or "N/A",
+            }
+    except Exception:
+        return {}
+
+
+def clear_list_cache() -> None:
+    """Drop the cached vessel list pages."""
+    _list_cache.clear()
+
+
+def _clear_list_cache_after_commit(_session: Session) -> None:
+    clear_list_cache()
+
 
 class VesselService:
     def __init__(self, repo: VesselRepository):
@@ -27,126 +97,115 @@ class VesselService:
 
     # ── Helpers ────────────────────────────────────────────────────────────────
 
-    def _get_analytics_metrics(self, vessel_id: int) -> dict:
-        """Fetch old-style analytics fields from analytics service with safe fallbacks."""
-        metrics = {
-            "speed_water": 0.0,
-            "me_fuel_consumption_nmile": 0.0,
-            "latest_cii": 0.0,
-            "cii_rating": "N/A",
-        }
-
-        # Average speed and nmile consumption
-        try:
-            avg_url = f"{settings.analytics_service_url}/optimization/vessel/{vessel_id}/average"
-            with urlopen(avg_url, timeout=settings.analytics_timeout_seconds) as response:
-                payload = json.loads(response.read().decode("utf-8"))
-                data = payload.get("data") or {}
-                metrics["speed_water"] = float(data.get("speed_water") or 0.0)
-                metrics["me_fuel_consumption_nmile"] = float(
-                    data.get("me_fuel_consumption_nmile") or 0.0
-                )
-        except Exception:
-            pass
-
-        # Latest CII and rating
-        try:
-            cii_url = f"{settings.analytics_service_url}/statistic/vessel/{vessel_id}/cii"
-            with urlopen(cii_url, timeout=settings.analytics_timeout_seconds) as response:
-                payload = json.loads(response.read().decode("utf-8"))
-                items = payload.get("data") or []
-                if items:
-                    latest = items[-1]
-                    metrics["latest_cii"] = float(latest.get("cii") or 0.0)
-                    metrics["cii_rating"] = latest.get("rating") or "N/A"
-        except Exception:
-            pass
+    def _get_analytics_metrics(self, vessel_ids: list[int]) -> list[dict]:
+        """Fetch old-style analytics fields from analytics service with safe fallbacks.
 
+        Both lookups for a batch of vessels are in flight at once, so a page costs about one
+        analytics round-trip per batch instead of two per vessel.
+        """
+        metrics = []
+        for start in range(0, len(vessel_ids), _METRICS_BATCH):
+            batch = vessel_ids[start : start + _METRICS_BATCH]
+            averages = [_METRICS_EXECUTOR.submit(_fetch_average, vid) for vid in batch]
+            ciis = [_METRICS_EXECUTOR.submit(_fetch_cii, vid) for vid in batch]
+            metrics.extend(
+                {**_DEFAULT_METRICS, **avg.result(), **cii.result()}
+                for avg, cii in zip(averages, ciis, strict=True)
+            )
         return metrics
 
-    def _build_schema(self, vessel: Vessel) -> VesselSchema:
-        """Assemble VesselSchema from ORM relationships."""
-        equipments = [
-            EquipmentSchema(
-                name=e.name,
-                type=e.type,
-                fuel_type_ids=[ef.fuel_type_id for ef in e.fuel_entries],
-            )
-            for e in vessel.equipments
-        ]
-        curves = [
-            PowerSpeedCurveSchema(
-                id=c.id,
-                curve_name=c.curve_name,
-                draft_astern=c.draft_astern,
-                draft_bow=c.draft_bow,
-                curve_data=[CurveDataSchema.model_validate(cd) for cd in c.curve_data],
-            )
-            for c in vessel.curves
-        ]
-        metrics = self._get_analytics_metrics(vessel.id)
-
-        return VesselSchema(
-            id=vessel.id,
-            name=vessel.name,
-            mmsi=vessel.mmsi,
-            ship_type=vessel.ship_type,
-            build_date=vessel.build_date,
-            gross_tone=vessel.gross_tone,
-            dead_weight=vessel.dead_weight,
-            new_vessel=vessel.new_vessel,
-            pitch=vessel.pitch,
-            hull_clean_date=vessel.hull_clean_date,
-            engine_overhaul_date=vessel.engine_overhaul_date,
-            newly_paint_date=vessel.newly_paint_date,
-            propeller_polish_date=vessel.propeller_polish_date,
-            time_zone=vessel.time_zone,
-            company_id=vessel.company_id,
-            created_at=vessel.created_at,
-            equipments=equipments,
-            curves=curves,
-            # Old response aliases
-            equipment_fuel=equipments,
-            power_speed_curve=curves,
-            speed_water=metrics["speed_water"],
-            me_fuel_consumption_nmile=metrics["me_fuel_consumption_nmile"],
-            latest_cii=metrics["latest_cii"],
-            cii_rating=metrics["cii_rating"],
-            engine_state="Good",
-            hull_propeller_state="Anomaly",
+    def _vessel_data(self, vessel: Vessel, metrics: dict) -> dict:
+        """Shape a vessel for VesselSchema.
+
+        The nested lists are validated once, straight from the ORM objects, and the resulting
+        instances are shared by the new fields and their old aliases; the outer validation
+        passes model instances through without validating them again.
+        """
+        equipments = _EQUIPMENT_LIST_ADAPTER.validate_python(
+            vessel.equipments, from_attributes=True
         )
+        curves = _CURVE_LIST_ADAPTER.validate_python(vessel.curves, from_attributes=True)
+        return {
+            "id": vessel.id,
+            "name": vessel.name,
+            "mmsi": vessel.mmsi,
+            "ship_type": vessel.ship_type,
+            "build_date": vessel.build_date,
+            "gross_tone": vessel.gross_tone,
+            "dead_weight": vessel.dead_weight,
+            "new_vessel": vessel.new_vessel,
+            "pitch": vessel.pitch,
+            "hull_clean_date": vessel.hull_clean_date,
+            "engine_overhaul_date": vessel.engine_overhaul_date,
+            "newly_paint_date": vessel.newly_paint_date,
+            "propeller_polish_date": vessel.propeller_polish_date,
+            "time_zone": vessel.time_zone,
+            "company_id": vessel.company_id,
+            "created_at": vessel.created_at,
+            "equipments": equipments,
+            "curves": curves,
+            # Old response aliases
+            "equipment_fuel": equipments,
+            "power_speed_curve": curves,
+            **metrics,
+            "engine_state": "Good",
+            "hull_propeller_state": "Anomaly",
+        }
+
+    def _build_schema(self, vessel: Vessel, metrics: dict) -> VesselSchema:
+        """Assemble VesselSchema from ORM relationships."""
+        return _VESSEL_ADAPTER.validate_python(self._vessel_data(vessel, metrics))
+
+    def _clear_list_cache_on_commit(self) -> None:
+        # Cleared when the write commits, not when it is issued: a list read in between would
+        # still see, and cache, the old rows.
+        event.listen(self.repo.session, "after_commit", _clear_list_cache_after_commit, once=True)
 
     def _create_equipments(
         self, session: Session, vessel_id: int, items: list[EquipmentCreate]
     ) -> None:
-        for eq_data in items:
-            eq = Equipment(name=eq_data.name, type=eq_data.type, vessel_id=vessel_id)
-            session.add(eq)
-            session.flush()
-            for fuel_id in eq_data.fuel_type_ids:
-                session.add(EquipmentFuel(equipment_id=eq.id, fuel_type_id=fuel_id))
+        equipments = [
+            Equipment(name=eq_data.name, type=eq_data.type, vessel_id=vessel_id)
+            for eq_data in items
+        ]
+        # One flush assigns every id (a batched INSERT ... RETURNING where supported).
+        session.add_all(equipments)
+        session.flush()
+        rows = [
+            {"equipment_id": eq.id, "fuel_type_id": fuel_id}
+            for eq, eq_data in zip(equipments, items, strict=True)
+            for fuel_id in eq_data.fuel_type_ids
+        ]
+        if rows:
+            session.execute(insert(EquipmentFuel), rows)
 
     def _create_curves(
         self, session: Session, vessel_id: int, items: list[PowerSpeedCurveCreate]
     ) -> None:
-        for curve_data in items:
-            curve = PowerSpeedCurve(
+        curves = [
+            PowerSpeedCurve(
                 curve_name=curve_data.curve_name,
                 draft_astern=curve_data.draft_astern,
                 draft_bow=curve_data.draft_bow,
                 vessel_id=vessel_id,
             )
-            session.add(curve)
-            session.flush()
-            for cd in curve_data.curve_data:
-                # Append to the ORM collection so the in-memory state stays consistent
-                curve.curve_data.append(
-                    CurveData(
-                        speed_water=cd.speed_water,
-                        me_power=cd.me_power,
-                        power_speed_curve_id=curve.id,
-                    )
-                )
+            for curve_data in items
+        ]
+        session.add_all(curves)
+        session.flush()
+        # One executemany INSERT for the points of all curves. The curves' collections stay
+        # unloaded, so they are read back from the database when serialized.
+        rows = [
+            {
+                "speed_water": cd.speed_water,
+                "me_power": cd.me_power,
+                "power_speed_curve_id": curve.id,
+            }
+            for curve, curve_data in zip(curves, items, strict=True)
+            for cd in curve_data.curve_data
+        ]
+        if rows:
+            session.execute(insert(CurveData), rows)
 
     # ── CRUD ───────────────────────────────────────────────────────────────────
 
@@ -156,13 +215,49 @@ class VesselService:
         company_id: int | None = None,
         offset: int = 0,
         limit: int = 10,
+        after_id: int | None = None,
     ) -> list[VesselSchema]:
-        vessels = self.repo.list_vessels(name, company_id, offset, limit)
-        return [self._build_schema(v) for v in vessels]
+        vessels = self.repo.list_vessels(name, company_id, offset, limit, after_id)
+        metrics = self._get_analytics_metrics([v.id for v in vessels])
+        # One validator call for the whole page instead of one per vessel.
+        return _VESSEL_LIST_ADAPTER.validate_python(
+            [self._vessel_data(v, m) for v, m in zip(vessels, metrics, strict=True)]
+        )
+
+    def get_vessel_list_encoded(
+        self,
+        name: str | None = None,
+        company_id: int | None = None,
+        offset: int = 0,
+        limit: int = 10,
+        after_id: int | None = None,
+        msgpack: bool = False,
+    ) -> tuple[bytes, int | None]:
+        """The vessel list encoded as a JSON (or MessagePack) array, and the next page's cursor.
+
+        The cursor is the id of the last vessel of a full page, None after the last page.
+        Both are cached for a short while.
+        """
+        key = (name, company_id, offset, limit, after_id, msgpack)
+        hit = _list_cache.get(key)
+        if hit is not None:
+            return hit
+
+        # A page built while a write committed is not stored, so it cannot bring back old rows.
+        generation = _list_cache.generation
+        vessels = self.get_vessel_list(name, company_id, offset, limit, after_id)
+        if msgpack:
+            body = ormsgpack.packb(vessels, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+        else:
+            # pydantic-core writes the list straight to JSON bytes, without building dicts.
+            body = _VESSEL_LIST_ADAPTER.dump_json(vessels)
+        next_cursor = vessels[-1].id if vessels and len(vessels) == limit else None
+        _list_cache.set(key, (body, next_cursor), generation)
+        return body, next_cursor
 
     def get_vessel_by_id(self, vessel_id: int) -> VesselSchema:
         vessel = self.repo.get_or_raise(vessel_id)
-        return self._build_schema(vessel)
+        return self._build_schema(vessel, self._get_analytics_metrics([vessel.id])[0])
 
     def create_vessel(self, data: VesselCreate) -> VesselSchema:
         vessel = Vessel(**data.model_dump(exclude={"equipments", "curves"}))
@@ -171,32 +266,44 @@ class VesselService:
 
         self._create_equipments(self.repo.session, vessel.id, data.equipments)
         self._create_curves(self.repo.session, vessel.id, data.curves)
+        self._clear_list_cache_on_commit()
 
-        self.repo.session.flush()  # assign IDs to all pending objects
-        self.repo.session.refresh(vessel)
-        return self._build_schema(vessel)
+        # No refresh: created_at came back with the INSERT and the unloaded child collections
+        # are read from the database when the schema is built.
+        return self._build_schema(vessel, self._get_analytics_metrics([vessel.id])[0])
 
     def update_vessel(self, vessel_id: int, data: VesselUpdate) -> VesselSchema:
         vessel = self.repo.get_or_raise(vessel_id)
+        fields = data.model_fields_set
+        if not fields:
+            # Nothing to write.
+            return self._build_schema(vessel, self._get_analytics_metrics([vessel.id])[0])
 
-        # Update scalar fields
-        base_fields = data.model_dump(exclude={"equipments", "curves"}, exclude_unset=True)
-        for key, value in base_fields.items():
-            setattr(vessel, key, value)
-
-        # Replace equipment and curves
-        vessel.equipments.clear()
-        vessel.curves.clear()
-        self.repo.session.flush()
+        # Update scalar fields: only those the client sent, read straight off the model
+        # instead of serializing it with model_dump.
+        for key in fields - {"equipments", "curves"}:
+            setattr(vessel, key, getattr(data, key))
 
-        self._create_equipments(self.repo.session, vessel.id, data.equipments)
-        self._create_curves(self.repo.session, vessel.id, data.curves)
+        # Replace equipment and curves only when the client sent them
+        session = self.repo.session
+        if data.equipments is not None:
+            self.repo.delete_equipments(vessel.id)
+            session.expire(vessel, ["equipments"])
+            self._create_equipments(session, vessel.id, data.equipments)
+        if data.curves is not None:
+            self.repo.delete_curves(vessel.id)
+            session.expire(vessel, ["curves"])
+            self._create_curves(session, vessel.id, data.curves)
 
-        self.repo.session.refresh(vessel)
-        return self._build_schema(vessel)
+        # Write the scalar changes now so errors such as a duplicate name surface here.
+        # Replaced collections were expired above and reload from the new rows; no refresh.
+        session.flush()
+        self._clear_list_cache_on_commit()
+        return self._build_schema(vessel, self._get_analytics_metrics([vessel.id])[0])
 
     def delete_vessel(self, vessel_id: int) -> None:
         vessel = self.repo.get_or_raise(vessel_id)
         self.repo.session.delete(vessel)
+        self._clear_list_cache_on_commit()
         if not vessel:
             raise EntityNotFoundError("Vessel", vessel_id)
@@ -1,28 +1,94 @@
-from common.auth import create_access_token, decode_token, get_password_hash, verify_password
-from common.database import create_engine_from_url, get_session
-from common.exceptions import (
-    AppError,
-    AuthenticationError,
-    AuthorizationError,
-    EntityNotFoundError,
-    ValidationError,
-    setup_exception_handlers,
-)
-from common.logging import setup_logging
-from common.models import Base, IntIDMixin, TimestampMixin
-from common.repository import BaseRepository
-from common.schemas import ResponseModel
+"""Shared building blocks for the services.
+
+Names are imported from their submodule on first access (PEP 562), so a process that only
+needs, say, ``common.logging`` does not also import bcrypt, PyJWT, SQLAlchemy and FastAPI.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from common.auth import (
+        cached_password_check,
+        clear_password_cache,
+        create_access_token,
+        decode_token,
+        get_password_hash,
+        verify_password,
+        verify_password_cached,
+    )
+    from common.cache import TTLCache
+    from common.database import create_engine_from_url, get_session
+    from common.exceptions import (
+        AppError,
+        AuthenticationError,
+        AuthorizationError,
+        EntityNotFoundError,
+        ValidationError,
+        setup_exception_handlers,
+    )
+    from common.logging import setup_logging
+    from common.models import Base, IntIDMixin, TimestampMixin
+    from common.repository import BaseRepository
+    from common.responses import FastORJSONResponse
+    from common.schemas import ResponseModel
+
+# Public name -> defining submodule.
+_EXPORTS = {
+    "cached_password_check": "common.auth",
+    "clear_password_cache": "common.auth",
+    "create_access_token": "common.auth",
+    "decode_token": "common.auth",
+    "get_password_hash": "common.auth",
+    "verify_password": "common.auth",
+    "verify_password_cached": "common.auth",
+    "TTLCache": "common.cache",
+    "create_engine_from_url": "common.database",
+    "get_session": "common.database",
+    "AppError": "common.exceptions",
+    "AuthenticationError": "common.exceptions",
+    "AuthorizationError": "common.exceptions",
+    "EntityNotFoundError": "common.exceptions",
+    "ValidationError": "common.exceptions",
+    "setup_exception_handlers": "common.exceptions",
+    "setup_logging": "common.logging",
+    "Base": "common.models",
+    "IntIDMixin": "common.models",
+    "TimestampMixin": "common.models",
+    "BaseRepository": "common.repository",
+    "FastORJSONResponse": "common.responses",
+    "ResponseModel": "common.schemas",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "create_access_token",
     "decode_token",
     "get_password_hash",
     "verify_password",
+    "verify_password_cached",
+    "cached_password_check",
+    "clear_password_cache",
+    "TTLCache",
     "Base",
     "IntIDMixin",
     "TimestampMixin",
     "BaseRepository",
     "ResponseModel",
+    "FastORJSONResponse",
     "AppError",
     "EntityNotFoundError",
     "ValidationError",
@@ -1,16 +1,26 @@
 """Authentication utilities: password hashing and JWT token management."""
 
+import base64
+import hashlib
+import hmac
+import secrets
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 import bcrypt
-from jwt import InvalidTokenError, decode, encode
+from jwt import InvalidTokenError, PyJWK, PyJWT, encode
 
+from common.cache import TTLCache
 from common.exceptions import AuthenticationError
 
 
-def get_password_hash(password: str) -> str:
-    """Return the bcrypt hash of a password."""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+def get_password_hash(password: str, rounds: int = 12) -> str:
+    """Return the bcrypt hash of a password.
+
+    ``rounds`` is the bcrypt cost factor; each step doubles the hashing time.
+    Existing hashes keep verifying because the cost is encoded in the hash.
+    """
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds)).decode()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -18,6 +28,43 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
 
 
+# Short-lived memo of successful bcrypt checks so bursts of requests with the same valid
+# credentials don't re-run the KDF. Failures are never remembered: a wrong password always
+# costs a full bcrypt run, so response time cannot tell a repeated guess from a new one.
+# Keys hold the stored hash plus an HMAC of the submitted password under a per-process
+# random key, never the password itself; changing a password changes the stored hash, so
+# old entries can no longer match.
+_VERIFY_CACHE_TTL = 60.0
+_VERIFY_CACHE_MAX = 2048
+_verify_key = secrets.token_bytes(32)
+_verify_cache: TTLCache[tuple[str, bytes], bool] = TTLCache(_VERIFY_CACHE_TTL, _VERIFY_CACHE_MAX)
+
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> tuple[str, bytes]:
+    return hashed_password, hmac.digest(_verify_key, plain_password.encode(), hashlib.sha256)
+
+
+def cached_password_check(plain_password: str, hashed_password: str) -> bool | None:
+    """Return True for a remembered successful check, or None if it must be computed."""
+    return _verify_cache.get(_verify_cache_key(plain_password, hashed_password))
+
+
+def verify_password_cached(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` that remembers successful checks for a minute."""
+    key = _verify_cache_key(plain_password, hashed_password)
+    if _verify_cache.get(key):
+        return True
+    ok = verify_password(plain_password, hashed_password)
+    if ok:
+        _verify_cache.set(key, True)
+    return ok
+
+
+def clear_password_cache() -> None:
+    """Forget all remembered outcomes (e.g. after a logout or password reset)."""
+    _verify_cache.clear()
+
+
 def create_access_token(
     data: dict,
     secret_key: str,
@@ -31,6 +78,22 @@ def create_access_token(
     return encode(to_encode, secret_key, algorithm=algorithm)
 
 
+_JWT = PyJWT()
+
+
+@lru_cache(maxsize=16)
+def _verification_key(secret_key: str, algorithm: str) -> PyJWK | str:
+    """Key for ``decode``, prepared once per (secret, algorithm).
+
+    A PyJWK carries the already-prepared HMAC key and algorithm object, so decoding skips
+    key preparation and the algorithm lookup. Other algorithms keep the raw key.
+    """
+    if not algorithm.startswith("HS"):
+        return secret_key
+    k = base64.urlsafe_b64encode(secret_key.encode()).rstrip(b"=").decode()
+    return PyJWK({"kty": "oct", "k": k}, algorithm=algorithm)
+
+
 def decode_token(token: str, secret_key: str, algorithm: str = "HS256") -> dict:
     """Decode and verify a JWT, returning its payload.
 
@@ -38,6 +101,6 @@ def decode_token(token: str, secret_key: str, algorithm: str = "HS256") -> dict:
         AuthenticationError: If the token is invalid or expired.
     """
     try:
-        return decode(token, secret_key, algorithms=[algorithm])
+        return _JWT.decode(token, _verification_key(secret_key, algorithm), algorithms=[algorithm])
     except InvalidTokenError as err:
         raise AuthenticationError("Could not validate credentials") from err
@@ -0,0 +1,53 @@
+"""Small in-process cache shared by the services."""
+
+import threading
+import time
+from collections.abc import Hashable, Iterator
+
+
+class TTLCache[K: Hashable, V]:
+    """Bounded mapping whose entries expire ``ttl`` seconds after they are stored.
+
+    Once ``maxsize`` entries are held, storing a new key drops the oldest one. Writes take a
+    lock, so sync handlers running on several threadpool threads can share one instance.
+
+    ``generation`` counts the clears. A caller building a value from data that a concurrent
+    write may change reads it first and hands it to :meth:`set`, which skips the store if a
+    clear happened in between.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.generation = 0
+        self._data: dict[K, tuple[V, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """The value stored under ``key``, or None if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """Store ``value``, unless ``generation`` is given and a clear has happened since."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # Dicts keep insertion order: drop the oldest entry.
+                del self._data[next(iter(self._data))]
+            self._data[key] = (value, time.monotonic() + self.ttl)
+
+    def clear(self) -> None:
+        """Drop every entry and start a new generation."""
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._data))
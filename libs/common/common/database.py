@@ -6,12 +6,38 @@ from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 
-def create_engine_from_url(url: str, *, echo: bool = False) -> Engine:
-    """Create a SQLAlchemy engine from a database URL."""
+def create_engine_from_url(
+    url: str,
+    *,
+    echo: bool = False,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_recycle: int = -1,
+    pool_pre_ping: bool = False,
+) -> Engine:
+    """Create a SQLAlchemy engine from a database URL.
+
+    ``pool_size``/``max_overflow`` are only forwarded when given, so the dialect's default
+    pool (e.g. SingletonThreadPool for in-memory SQLite) is kept otherwise. ``pool_pre_ping``
+    tests each connection on checkout, so connections dropped by the server are replaced
+    instead of failing the request.
+    """
     connect_args = {}
     if url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
-    return create_engine(url, echo=echo, connect_args=connect_args)
+    pool_args = {}
+    if pool_size is not None:
+        pool_args["pool_size"] = pool_size
+    if max_overflow is not None:
+        pool_args["max_overflow"] = max_overflow
+    return create_engine(
+        url,
+        echo=echo,
+        connect_args=connect_args,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        **pool_args,
+    )
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -2,11 +2,14 @@
 
 import logging
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from sqlalchemy.exc import IntegrityError
 
+from common.responses import FastORJSONResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,14 +55,28 @@ class AuthorizationError(AppError):
 
 # --- Exception Handlers ---
 
+# Auth failures with the default message are the most frequent errors and always encode to
+# the same bytes, so their bodies are built once.
+_STATIC_ERROR_BODIES = {
+    (err.code, err.message): orjson.dumps({"code": err.code, "data": None, "message": err.message})
+    for err in (AuthenticationError(), AuthorizationError())
+}
+
 
 def setup_exception_handlers(app: FastAPI) -> None:
-    """Register all exception handlers on a FastAPI app."""
+    """Register all exception handlers on a FastAPI app.
+
+    Error bodies are encoded with orjson like the apps' other responses, which matters when
+    a client sends a burst of invalid requests.
+    """
 
     @app.exception_handler(AppError)
-    async def app_error_handler(_request: Request, exc: AppError) -> JSONResponse:
+    async def app_error_handler(_request: Request, exc: AppError) -> Response:
         logger.error("AppError: %s", exc.message)
-        return JSONResponse(
+        body = _STATIC_ERROR_BODIES.get((exc.code, exc.message))
+        if body is not None:
+            return Response(body, status_code=exc.code, media_type="application/json")
+        return FastORJSONResponse(
             status_code=exc.code,
             content={"code": exc.code, "data": None, "message": exc.message},
         )
@@ -67,17 +84,17 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(RequestValidationError)
     async def validation_error_handler(
         _request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> FastORJSONResponse:
         logger.error("Validation error: %s", exc.errors())
-        return JSONResponse(
+        return FastORJSONResponse(
             status_code=422,
             content={"code": 422, "data": exc.errors(), "message": "请求参数不符合要求"},
         )
 
     @app.exception_handler(IntegrityError)
-    async def integrity_error_handler(_request: Request, exc: IntegrityError) -> JSONResponse:
+    async def integrity_error_handler(_request: Request, exc: IntegrityError) -> FastORJSONResponse:
         logger.error("Integrity error: %s", exc)
-        return JSONResponse(
+        return FastORJSONResponse(
             status_code=400,
             content={
                 "code": 400,
@@ -87,8 +104,8 @@ def setup_exception_handlers(app: FastAPI) -> None:
         )
 
     @app.exception_handler(HTTPException)
-    async def http_exception_handler(_request: Request, exc: HTTPException) -> JSONResponse:
-        return JSONResponse(
+    async def http_exception_handler(_request: Request, exc: HTTPException) -> FastORJSONResponse:
+        return FastORJSONResponse(
             status_code=exc.status_code,
             content={"code": exc.status_code, "data": None, "message": exc.detail},
         )
@@ -1,18 +1,50 @@
 """Structured JSON logging setup for microservices."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
-from pythonjsonlogger.json import JsonFormatter
+from pythonjsonlogger.orjson import OrjsonFormatter
+
+# Background listener that formats and writes records; replaced on every setup_logging call.
+_listener: QueueListener | None = None
+
+
+class _LocalQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    The stock ``prepare`` formats the message and drops ``exc_info`` so records can be
+    pickled; records never leave the process here, so they are enqueued untouched and the
+    JSON formatter on the listener thread still sees the exception.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()  # drains queued records before returning
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging(service: str, level: str = "INFO") -> None:
     """Configure root logger to emit structured JSON to stdout.
 
-    Each log record includes a 'service' field for Loki label filtering.
+    Each log record includes a 'service' field for Loki label filtering. Logging calls only
+    enqueue the record; JSON formatting and the stdout write happen on a listener thread.
     """
+    global _listener
     handler = logging.StreamHandler(sys.stdout)
-    formatter = JsonFormatter(
+    # orjson encodes several times faster than the stdlib json formatter and writes non-ASCII
+    # (Chinese messages) as UTF-8 instead of \u escapes.
+    formatter = OrjsonFormatter(
         fmt="%(asctime)s %(levelname)s %(name)s %(service)s %(message)s",
         rename_fields={
             "asctime": "timestamp",
@@ -22,17 +54,26 @@ def setup_logging(service: str, level: str = "INFO") -> None:
     )
     handler.setFormatter(formatter)
 
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
     root = logging.getLogger()
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(_LocalQueueHandler(log_queue))
     root.setLevel(level)
 
-    # Inject 'service' field into every LogRecord
+    # Inject 'service' field into every LogRecord. Unwrap a factory installed by an earlier
+    # call (each app lifespan calls this) so repeated setup doesn't stack wrappers that every
+    # log record would then pass through.
     old_factory = logging.getLogRecordFactory()
+    old_factory = getattr(old_factory, "__wrapped__", old_factory)
 
     def _factory(*args, **kwargs):
         record = old_factory(*args, **kwargs)
         record.service = service
         return record
 
+    _factory.__wrapped__ = old_factory
     logging.setLogRecordFactory(_factory)
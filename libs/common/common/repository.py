@@ -1,6 +1,7 @@
 """Generic base repository with common CRUD operations."""
 
 import logging
+from collections.abc import Sequence
 from typing import Generic, TypeVar
 
 from sqlalchemy import select
@@ -22,6 +23,9 @@ class BaseRepository(Generic[T]):
                 super().__init__(session, User)
     """
 
+    # Repositories are created per request; slots keep them to two pointers.
+    __slots__ = ("session", "model")
+
     def __init__(self, session: Session, model: type[T]):
         self.session = session
         self.model = model
@@ -35,9 +39,9 @@ class BaseRepository(Generic[T]):
             raise EntityNotFoundError(self.model.__name__, id)
         return entity
 
-    def list_all(self, *, offset: int = 0, limit: int = 100) -> list[T]:
+    def list_all(self, *, offset: int = 0, limit: int = 100) -> Sequence[T]:
         stmt = select(self.model).offset(offset).limit(limit)
-        return list(self.session.scalars(stmt).all())
+        return self.session.scalars(stmt).all()
 
     def create(self, entity: T) -> T:
         self.session.add(entity)
@@ -0,0 +1,33 @@
+"""Response classes shared across services."""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        # Same shape as FastAPI's response_model path: aliases and JSON-mode field types.
+        return obj.model_dump(mode="json", by_alias=True)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class FastORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also accepts Pydantic models and Decimals anywhere in the content.
+
+    Handlers can return ``FastORJSONResponse({"code": 200, "data": models, ...})`` and have
+    the whole envelope encoded in one orjson call, without a ``model_dump`` pass first.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
@@ -0,0 +1,109 @@
+"""Shared pytest fixtures and helpers for the service test suites.
+
+A suite loads them with ``addopts = ["-p", "common.testing"]`` in its pytest settings (early,
+so its conftest can import the helpers) and adds only what is its own: seed data, a
+``module_client`` built with :func:`startup_client`, and a ``client`` that overrides
+``get_db`` with :func:`savepoint_get_db`.
+
+Each test module gets one in-memory database. Every test runs in an outer transaction that
+is rolled back afterwards; sessions opened by requests commit into savepoints inside it.
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Connection, Engine, create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from common.models import Base
+
+
+def create_test_engine() -> Engine:
+    """In-memory SQLite engine with every registered table, ready for savepoint isolation."""
+    eng = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN itself.
+    @event.listens_for(eng, "connect")
+    def _disable_pysqlite_transactions(dbapi_conn, _record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(eng, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(eng)
+    return eng
+
+
+@contextmanager
+def startup_client(
+    create_app: Callable[[], FastAPI], app_module: str, db_dir: Path
+) -> Iterator[TestClient]:
+    """TestClient for a new app whose lifespan runs against a throwaway file in ``db_dir``.
+
+    ``app_module`` is the module whose ``engine`` the lifespan uses. Keeping startup off the
+    configured database file lets parallel workers (``pytest -n auto``) run side by side.
+    """
+    startup_engine = create_engine(f"sqlite:///{db_dir / 'startup.db'}")
+    try:
+        with patch(f"{app_module}.engine", startup_engine), TestClient(create_app()) as client:
+            yield client
+    finally:
+        startup_engine.dispose()
+
+
+def savepoint_get_db(factory: sessionmaker[Session]) -> Callable[[], Iterator[Session]]:
+    """``get_db`` override that commits like the real one, into the test's savepoint."""
+
+    def override_get_db() -> Iterator[Session]:
+        sess = factory()
+        try:
+            yield sess
+            sess.commit()
+        except Exception:
+            sess.rollback()
+            raise
+        finally:
+            sess.close()
+
+    return override_get_db
+
+
+@pytest.fixture(scope="module")
+def engine() -> Iterator[Engine]:
+    """One in-memory database per test module; tests are isolated by rolling back."""
+    eng = create_test_engine()
+    yield eng
+    Base.metadata.drop_all(eng)
+    eng.dispose()
+
+
+@pytest.fixture
+def connection(engine: Engine) -> Iterator[Connection]:
+    """Per-test outer transaction; everything a test commits is rolled back afterwards."""
+    conn = engine.connect()
+    trans = conn.begin()
+    yield conn
+    trans.rollback()
+    conn.close()
+
+
+@pytest.fixture
+def session_factory(connection: Connection) -> sessionmaker[Session]:
+    """Sessions on the test's connection; their commits only release a savepoint."""
+    return sessionmaker(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
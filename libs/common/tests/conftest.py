@@ -1,10 +1,10 @@
 """Common test fixtures."""
 
 import pytest
-from common.database import create_engine_from_url, create_session_factory
 from common.models import Base, IntIDMixin
-from sqlalchemy import String
-from sqlalchemy.orm import Mapped, mapped_column
+from common.testing import create_test_engine
+from sqlalchemy import ForeignKey, String, event
+from sqlalchemy.orm import Mapped, mapped_column, raiseload, relationship
 
 
 class SampleEntity(IntIDMixin, Base):
@@ -14,19 +14,41 @@ class SampleEntity(IntIDMixin, Base):
 
     name: Mapped[str] = mapped_column(String(50))
 
+    children: Mapped[list["SampleChild"]] = relationship(back_populates="parent")
 
-@pytest.fixture
+
+class SampleChild(IntIDMixin, Base):
+    """A related entity, so tests can exercise relationship loading."""
+
+    __tablename__ = "sample_child"
+
+    parent_id: Mapped[int] = mapped_column(ForeignKey("sample_entity.id"))
+
+    parent: Mapped[SampleEntity] = relationship(back_populates="children")
+
+
+@pytest.fixture(scope="session")
 def engine():
-    eng = create_engine_from_url("sqlite:///:memory:")
-    Base.metadata.create_all(eng)
+    """One in-memory database for the whole run; tests are isolated by rolling back."""
+    eng = create_test_engine()
     yield eng
     Base.metadata.drop_all(eng)
     eng.dispose()
 
 
 @pytest.fixture
-def session(engine):
-    factory = create_session_factory(engine)
-    sess = factory()
+def session(session_factory):
+    """Session on the test's connection; its commits only release a savepoint.
+
+    Every ORM query gets ``raiseload("*")``, so a relationship touched without being loaded
+    up front fails the test instead of quietly issuing one query per row (N+1).
+    """
+    sess = session_factory()
+
+    @event.listens_for(sess, "do_orm_execute")
+    def _forbid_lazy_loads(state):
+        if state.is_select and not state.is_relationship_load:
+            state.statement = state.statement.options(raiseload("*"))
+
     yield sess
     sess.close()
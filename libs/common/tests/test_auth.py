@@ -1,63 +1,122 @@
 """Tests for authentication utilities."""
 
-from datetime import timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
+from common import auth
 from common.auth import (
+    cached_password_check,
+    clear_password_cache,
     create_access_token,
     decode_token,
     get_password_hash,
     verify_password,
+    verify_password_cached,
 )
+from common.cache import TTLCache
 from common.exceptions import AuthenticationError
 
 SECRET = "test-secret-key"
+PASSWORD = "mypassword"
+
+
+@pytest.fixture(scope="module")
+def hashed_password():
+    """One bcrypt hash for the module, at the minimum cost factor."""
+    return get_password_hash(PASSWORD, rounds=4)
+
+
+@pytest.fixture(scope="module")
+def valid_token():
+    return create_access_token({"sub": "42"}, secret_key=SECRET)
 
 
 class TestPasswordHashing:
-    def test_hash_and_verify(self):
-        hashed = get_password_hash("mypassword")
-        assert verify_password("mypassword", hashed)
+    def test_hash_and_verify(self, hashed_password):
+        assert verify_password(PASSWORD, hashed_password)
+
+    def test_wrong_password(self, hashed_password):
+        assert not verify_password("wrong", hashed_password)
+
+    def test_hash_is_not_plaintext(self, hashed_password):
+        assert hashed_password != PASSWORD
+
+    def test_cost_factor_is_encoded(self, hashed_password):
+        assert hashed_password.startswith("$2b$04$")
 
-    def test_wrong_password(self):
-        hashed = get_password_hash("correct")
-        assert not verify_password("wrong", hashed)
 
-    def test_hash_is_not_plaintext(self):
-        hashed = get_password_hash("secret")
-        assert hashed != "secret"
+class TestPasswordVerifyCache:
+    def test_only_successes_are_remembered(self, monkeypatch, hashed_password):
+        monkeypatch.setattr(auth, "_verify_cache", TTLCache(60.0, 16))
+        assert cached_password_check(PASSWORD, hashed_password) is None
+        assert verify_password_cached(PASSWORD, hashed_password)
+        assert not verify_password_cached("wrong", hashed_password)
+        assert cached_password_check(PASSWORD, hashed_password) is True
+        assert cached_password_check("wrong", hashed_password) is None
+        assert len(auth._verify_cache) == 1
+
+    def test_keys_do_not_hold_the_password(self, monkeypatch, hashed_password):
+        monkeypatch.setattr(auth, "_verify_cache", TTLCache(60.0, 16))
+        verify_password_cached(PASSWORD, hashed_password)
+        ((stored_hash, mac),) = auth._verify_cache
+        assert stored_hash == hashed_password
+        assert PASSWORD.encode() not in mac
+
+    def test_expired_and_cleared_entries_are_recomputed(self, monkeypatch, hashed_password):
+        monkeypatch.setattr(auth, "_verify_cache", TTLCache(60.0, 16))
+        monkeypatch.setattr(auth._verify_cache, "ttl", 0.0)
+        verify_password_cached(PASSWORD, hashed_password)
+        assert cached_password_check(PASSWORD, hashed_password) is None
+        auth._verify_cache.ttl = 60.0
+        verify_password_cached(PASSWORD, hashed_password)
+        clear_password_cache()
+        assert cached_password_check(PASSWORD, hashed_password) is None
 
 
 class TestJWT:
-    def test_create_and_decode(self):
-        token = create_access_token({"sub": "42"}, secret_key=SECRET)
-        payload = decode_token(token, secret_key=SECRET)
+    def test_create_and_decode(self, valid_token):
+        payload = decode_token(valid_token, secret_key=SECRET)
         assert payload["sub"] == "42"
         assert "exp" in payload
 
-    def test_custom_algorithm(self):
-        token = create_access_token({"sub": "1"}, secret_key=SECRET, algorithm="HS256")
-        payload = decode_token(token, secret_key=SECRET, algorithm="HS256")
+    @pytest.mark.parametrize("algorithm", ["HS256", "HS384", "HS512"])
+    def test_algorithms_round_trip(self, algorithm):
+        token = create_access_token({"sub": "1"}, secret_key=SECRET, algorithm=algorithm)
+        payload = decode_token(token, secret_key=SECRET, algorithm=algorithm)
         assert payload["sub"] == "1"
 
     def test_custom_expiry(self):
         delta = timedelta(hours=2)
         token = create_access_token({"sub": "1"}, secret_key=SECRET, expires_delta=delta)
         payload = decode_token(token, secret_key=SECRET)
-        assert payload["sub"] == "1"
+        assert payload["exp"] > (datetime.now(UTC) + timedelta(hours=1)).timestamp()
 
-    def test_expired_token(self):
-        token = create_access_token(
-            {"sub": "1"}, secret_key=SECRET, expires_delta=timedelta(seconds=-1)
-        )
+    @pytest.mark.parametrize(
+        ("make_token", "decode_kwargs"),
+        [
+            pytest.param(
+                lambda _: create_access_token(
+                    {"sub": "1"}, secret_key=SECRET, expires_delta=timedelta(seconds=-1)
+                ),
+                {},
+                id="expired",
+            ),
+            pytest.param(lambda _: "not-a-valid-token", {}, id="malformed"),
+            pytest.param(lambda valid: valid, {"secret_key": "wrong-key"}, id="wrong-secret"),
+            pytest.param(
+                lambda _: create_access_token({"sub": "1"}, secret_key=SECRET, algorithm="HS512"),
+                {"algorithm": "HS256"},
+                id="algorithm-mismatch",
+            ),
+        ],
+    )
+    def test_rejected_tokens(self, valid_token, make_token, decode_kwargs):
         with pytest.raises(AuthenticationError):
-            decode_token(token, secret_key=SECRET)
+            decode_token(make_token(valid_token), **{"secret_key": SECRET, **decode_kwargs})
 
-    def test_invalid_token(self):
-        with pytest.raises(AuthenticationError):
-            decode_token("not-a-valid-token", secret_key=SECRET)
-
-    def test_wrong_secret(self):
-        token = create_access_token({"sub": "1"}, secret_key=SECRET)
-        with pytest.raises(AuthenticationError):
-            decode_token(token, secret_key="wrong-key")
+    def test_verification_key_is_reused(self):
+        token = create_access_token({"sub": "1"}, secret_key=SECRET, algorithm="HS512")
+        decode_token(token, secret_key=SECRET, algorithm="HS512")
+        hits = auth._verification_key.cache_info().hits
+        assert decode_token(token, secret_key=SECRET, algorithm="HS512")["sub"] == "1"
+        assert auth._verification_key.cache_info().hits == hits + 1
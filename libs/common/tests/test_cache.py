@@ -0,0 +1,52 @@
+"""Tests for the bounded TTL cache."""
+
+import threading
+
+from common.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(ttl=60.0, maxsize=4)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_expired_entries_are_missing(self):
+        cache = TTLCache(ttl=0.0, maxsize=4)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_oldest_entry_is_evicted(self):
+        cache = TTLCache(ttl=60.0, maxsize=2)
+        for key in "abc":
+            cache.set(key, key)
+        assert list(cache) == ["b", "c"]
+
+    def test_set_after_clear_is_skipped(self):
+        cache = TTLCache(ttl=60.0, maxsize=4)
+        generation = cache.generation
+        cache.clear()
+        cache.set("a", 1, generation)
+        assert len(cache) == 0
+        cache.set("a", 1, cache.generation)
+        assert cache.get("a") == 1
+
+    def test_concurrent_eviction_does_not_raise(self):
+        cache = TTLCache(ttl=60.0, maxsize=256)
+        errors = []
+
+        def fill(offset: int) -> None:
+            try:
+                for i in range(5000):
+                    cache.set((offset, i), i)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=fill, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert len(cache) == 256
@@ -0,0 +1,30 @@
+"""Tests for engine construction helpers."""
+
+from common.database import create_engine_from_url
+from sqlalchemy.pool import QueuePool
+
+
+class TestCreateEngineFromUrl:
+    def test_pool_settings_are_applied(self, tmp_path):
+        engine = create_engine_from_url(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            pool_size=20,
+            max_overflow=40,
+            pool_recycle=3600,
+            pool_pre_ping=True,
+        )
+        try:
+            assert isinstance(engine.pool, QueuePool)
+            assert engine.pool.size() == 20
+            assert engine.pool._max_overflow == 40
+            assert engine.pool._recycle == 3600
+            assert engine.pool._pre_ping is True
+        finally:
+            engine.dispose()
+
+    def test_in_memory_sqlite_keeps_default_pool(self):
+        engine = create_engine_from_url("sqlite:///:memory:")
+        try:
+            assert not isinstance(engine.pool, QueuePool)
+        finally:
+            engine.dispose()
@@ -39,8 +39,9 @@ class TestExceptionClasses:
 
 
 class TestExceptionHandlers:
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
+        """One app for the class; the handlers and routes keep no per-test state."""
         app = FastAPI()
         setup_exception_handlers(app)
 
@@ -56,6 +57,18 @@ class TestExceptionHandlers:
         async def raise_auth_error():
             raise AuthenticationError()
 
+        @app.get("/forbidden")
+        async def raise_forbidden():
+            raise AuthorizationError()
+
+        @app.get("/custom-auth-error")
+        async def raise_custom_auth_error():
+            raise AuthenticationError("令牌已过期")
+
+        @app.get("/typed")
+        async def typed(n: int):
+            return n
+
         return TestClient(app, raise_server_exceptions=False)
 
     def test_app_error_handler(self, client):
@@ -75,3 +88,23 @@ class TestExceptionHandlers:
     def test_auth_error_handler(self, client):
         resp = client.get("/auth-error")
         assert resp.status_code == 401
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == {"code": 401, "data": None, "message": "认证失败"}
+
+    def test_authorization_error_handler(self, client):
+        resp = client.get("/forbidden")
+        assert resp.status_code == 403
+        assert resp.json() == {"code": 403, "data": None, "message": "权限不足"}
+
+    def test_custom_auth_message(self, client):
+        resp = client.get("/custom-auth-error")
+        assert resp.status_code == 401
+        assert resp.json()["message"] == "令牌已过期"
+
+    def test_validation_error_handler(self, client):
+        resp = client.get("/typed", params={"n": "x"})
+        assert resp.status_code == 422
+        body = resp.json()
+        assert body["code"] == 422
+        assert body["data"][0]["loc"] == ["query", "n"]
+        assert body["message"] == "请求参数不符合要求"
@@ -0,0 +1,28 @@
+"""Tests for the lazy package exports."""
+
+import subprocess
+import sys
+
+import common
+import pytest
+
+
+class TestLazyExports:
+    def test_all_names_resolve(self):
+        for name in common.__all__:
+            assert getattr(common, name) is not None
+
+    def test_unknown_name_raises(self):
+        with pytest.raises(AttributeError):
+            common.does_not_exist  # noqa: B018
+
+    def test_submodule_import_skips_heavy_dependencies(self):
+        code = (
+            "import sys, common.logging; "
+            "print(sorted(m for m in ('bcrypt', 'jwt', 'sqlalchemy', 'fastapi') "
+            "if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
@@ -0,0 +1,57 @@
+"""Tests for structured logging setup."""
+
+import json
+import logging
+
+import pytest
+from common import logging as common_logging
+from common.logging import setup_logging
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger()
+    factory = logging.getLogRecordFactory()
+    handlers, level = root.handlers[:], root.level
+    yield
+    common_logging._stop_listener()
+    logging.setLogRecordFactory(factory)
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestSetupLogging:
+    def test_records_carry_service(self, restore_logging):
+        setup_logging("meta")
+        record = logging.getLogRecordFactory()("x", logging.INFO, __file__, 1, "msg", (), None)
+        assert record.service == "meta"
+
+    def test_repeated_setup_does_not_stack_factories(self, restore_logging):
+        base = logging.getLogRecordFactory()
+        setup_logging("meta")
+        setup_logging("identity")
+        factory = logging.getLogRecordFactory()
+        assert factory.__wrapped__ is base
+        record = factory("x", logging.INFO, __file__, 1, "msg", (), None)
+        assert record.service == "identity"
+        assert len(logging.getLogger().handlers) == 1
+
+    def test_records_are_written_by_listener(self, restore_logging, capsys):
+        setup_logging("vessel")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test").exception("failed %s", "op")
+        common_logging._stop_listener()
+        line = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+        assert line["message"] == "failed op"
+        assert line["service"] == "vessel"
+        assert "ValueError: boom" in line["exc_info"]
+
+    def test_non_ascii_is_not_escaped(self, restore_logging, capsys):
+        setup_logging("identity")
+        logging.getLogger("test").warning("数据重复")
+        common_logging._stop_listener()
+        out = capsys.readouterr().out.strip().splitlines()[-1]
+        assert "数据重复" in out
+        assert json.loads(out)["message"] == "数据重复"
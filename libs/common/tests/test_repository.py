@@ -3,12 +3,27 @@
 import pytest
 from common.exceptions import EntityNotFoundError
 from common.repository import BaseRepository
-from conftest import SampleEntity
+from conftest import SampleChild, SampleEntity
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+
+@pytest.fixture
+def repo(session):
+    return BaseRepository(session, SampleEntity)
+
+
+@pytest.fixture
+def seeded_entities(session):
+    """Five rows written in one flush; rolled back with the test's transaction."""
+    entities = [SampleEntity(name=f"item-{i}") for i in range(5)]
+    session.add_all(entities)
+    session.flush()
+    return entities
 
 
 class TestBaseRepository:
-    def test_create_and_get_by_id(self, session):
-        repo = BaseRepository(session, SampleEntity)
+    def test_create_and_get_by_id(self, repo, session):
         entity = SampleEntity(name="test")
 
         created = repo.create(entity)
@@ -18,43 +33,29 @@ class TestBaseRepository:
         assert found is not None
         assert found.name == "test"
 
-    def test_get_by_id_returns_none(self, session):
-        repo = BaseRepository(session, SampleEntity)
+    def test_get_by_id_returns_none(self, repo):
         assert repo.get_by_id(999) is None
 
-    def test_get_or_raise_found(self, session):
-        repo = BaseRepository(session, SampleEntity)
+    def test_get_or_raise_found(self, repo, session):
         entity = repo.create(SampleEntity(name="exists"))
         session.commit()
 
         found = repo.get_or_raise(entity.id)
         assert found.name == "exists"
 
-    def test_get_or_raise_not_found(self, session):
-        repo = BaseRepository(session, SampleEntity)
+    def test_get_or_raise_not_found(self, repo):
         with pytest.raises(EntityNotFoundError):
             repo.get_or_raise(999)
 
-    def test_list_all(self, session):
-        repo = BaseRepository(session, SampleEntity)
-        for i in range(5):
-            repo.create(SampleEntity(name=f"item-{i}"))
-        session.commit()
-
+    def test_list_all(self, repo, seeded_entities):
         items = repo.list_all()
         assert len(items) == 5
 
-    def test_list_all_with_offset_limit(self, session):
-        repo = BaseRepository(session, SampleEntity)
-        for i in range(5):
-            repo.create(SampleEntity(name=f"item-{i}"))
-        session.commit()
-
+    def test_list_all_with_offset_limit(self, repo, seeded_entities):
         items = repo.list_all(offset=2, limit=2)
-        assert len(items) == 2
+        assert [e.name for e in items] == ["item-2", "item-3"]
 
-    def test_update(self, session):
-        repo = BaseRepository(session, SampleEntity)
+    def test_update(self, repo, session):
         entity = repo.create(SampleEntity(name="old"))
         session.commit()
 
@@ -64,8 +65,7 @@ class TestBaseRepository:
         found = repo.get_by_id(entity.id)
         assert found.name == "new"
 
-    def test_delete(self, session):
-        repo = BaseRepository(session, SampleEntity)
+    def test_delete(self, repo, session):
         entity = repo.create(SampleEntity(name="to-delete"))
         session.commit()
 
@@ -73,3 +73,18 @@ class TestBaseRepository:
         session.commit()
 
         assert repo.get_by_id(entity.id) is None
+
+    def test_lazy_loads_are_rejected(self, repo, session):
+        entity = repo.create(SampleEntity(name="parent", children=[SampleChild()]))
+        session.expunge_all()
+
+        found = repo.get_by_id(entity.id)
+        with pytest.raises(InvalidRequestError):
+            found.children  # noqa: B018
+
+    def test_eager_loads_are_allowed(self, repo, session):
+        entity = repo.create(SampleEntity(name="parent", children=[SampleChild()]))
+        session.expunge_all()
+
+        found = session.get(SampleEntity, entity.id, options=[selectinload(SampleEntity.children)])
+        assert len(found.children) == 1
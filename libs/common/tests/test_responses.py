@@ -0,0 +1,44 @@
+"""Tests for shared response classes."""
+
+from datetime import date
+from decimal import Decimal
+
+import orjson
+import pytest
+from common.responses import FastORJSONResponse
+from pydantic import BaseModel, Field
+
+
+class Item(BaseModel):
+    id: int
+    built: date
+
+
+class Tagged(BaseModel):
+    item_id: int = Field(serialization_alias="itemId")
+    tags: frozenset[str]
+
+
+class TestFastORJSONResponse:
+    def test_encodes_models_inside_envelope(self):
+        resp = FastORJSONResponse(
+            {"code": 200, "data": [Item(id=1, built=date(2020, 1, 1))], "message": "ok"}
+        )
+        assert orjson.loads(resp.body) == {
+            "code": 200,
+            "data": [{"id": 1, "built": "2020-01-01"}],
+            "message": "ok",
+        }
+        assert resp.media_type == "application/json"
+
+    def test_models_dump_like_response_model(self):
+        resp = FastORJSONResponse({"data": Tagged(item_id=1, tags=frozenset({"a"}))})
+        assert orjson.loads(resp.body) == {"data": {"itemId": 1, "tags": ["a"]}}
+
+    def test_decimal_and_int_keys(self):
+        resp = FastORJSONResponse({1: Decimal("2.5")})
+        assert orjson.loads(resp.body) == {"1": 2.5}
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(TypeError):
+            FastORJSONResponse({"data": object()})
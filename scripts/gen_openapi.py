@@ -2,10 +2,14 @@
 """Generate a combined OpenAPI JSON spec for all microservices.
 
 Usage (from services/ directory):
-    uv run python scripts/gen_openapi.py
+    uv run python scripts/gen_openapi.py [--no-cache]
 
 Output: docs/openapi.json
 
+Per-service specs are cached in docs/.openapi_cache/, keyed by a hash of the service's and
+common's source files and the FastAPI/pydantic versions. A run with nothing changed skips
+the app imports. --no-cache rebuilds every spec.
+
 Each service's component schemas are prefixed with the service name
 (e.g. ResponseModel → MetaResponseModel) to avoid collisions.
 Each path carries a path-level `servers` entry pointing to its actual host:port.
@@ -13,11 +17,20 @@ Each path carries a path-level `servers` entry pointing to its actual host:port.
 
 from __future__ import annotations
 
-import copy
+import argparse
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import version
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # the script can still run outside the workspace environment
+    orjson = None
+
 # ── Service registry ─────────────────────────────────────────────────────────
 
 SERVICES = [
@@ -55,6 +68,19 @@ SERVICES = [
     },
 ]
 
+# The info.description service table, built from SERVICES so it cannot drift from it
+_INFO_DESCRIPTION = (
+    f"整合 {' / '.join(svc['prefix'] for svc in SERVICES)} 共 {len(SERVICES)} 个微服务的"
+    " OpenAPI 文档。\n\n"
+    "每条路径通过 path-level `servers` 字段标明所属服务：\n\n"
+    "| 服务 | 地址 |\n"
+    "|------|------|\n"
+    + "\n".join(f"| {svc['description']} | {svc['server']} |" for svc in SERVICES)
+)
+
+_SERVICES_DIR = Path(__file__).parent.parent
+_CACHE_DIR = _SERVICES_DIR / "docs" / ".openapi_cache"
+
 # Paths shared by all services (health checks) — keep only one copy
 _SKIP_PATHS = {"/"}
 
@@ -62,20 +88,65 @@ _SKIP_PATHS = {"/"}
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def _prefix_refs(obj: object, prefix: str) -> object:
-    """Recursively rewrite all $ref values under #/components/schemas/."""
-    if isinstance(obj, dict):
-        return {
-            k: (
-                "#/components/schemas/" + prefix + v.removeprefix("#/components/schemas/")
-                if k == "$ref" and isinstance(v, str) and v.startswith("#/components/schemas/")
-                else _prefix_refs(v, prefix)
-            )
-            for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [_prefix_refs(item, prefix) for item in obj]
-    return obj
+_SCHEMA_REF = "#/components/schemas/"
+
+
+def _prefix_refs(obj: object, prefix: str, seen: set[int]) -> None:
+    """Rewrite, in place, all $ref values under #/components/schemas/.
+
+    Walks an explicit stack instead of recursing. ``seen`` holds the ids of containers already
+    rewritten, so a node shared between several places is prefixed only once.
+    """
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if k == "$ref" and isinstance(v, str) and v.startswith(_SCHEMA_REF):
+                    node[k] = _SCHEMA_REF + prefix + v.removeprefix(_SCHEMA_REF)
+                elif isinstance(v, dict | list):
+                    stack.append(v)
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, dict | list))
+
+
+def _dumps(obj: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+
+def _loads(data: bytes) -> object:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _source_hash(svc: dict) -> str:
+    """Hash of everything a service's spec is generated from, computed without importing it."""
+    digest = hashlib.sha256()
+    for pkg in ("fastapi", "pydantic"):
+        digest.update(f"{pkg}=={version(pkg)}\n".encode())
+    roots = (_SERVICES_DIR / "apps" / svc["name"] / svc["name"], _SERVICES_DIR / "libs" / "common")
+    for root in roots:
+        for path in sorted(root.rglob("*.py")):
+            digest.update(path.relative_to(_SERVICES_DIR).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _read_cached_spec(svc: dict, key: str) -> dict | None:
+    try:
+        cached = _loads((_CACHE_DIR / f"{svc['name']}.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+    return cached["spec"] if cached.get("hash") == key else None
+
+
+def _write_cached_spec(svc: dict, key: str, spec: dict) -> None:
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    (_CACHE_DIR / f"{svc['name']}.json").write_bytes(_dumps({"hash": key, "spec": spec}))
 
 
 def _import_app(module_path: str, attr: str):
@@ -92,22 +163,19 @@ def merge(service_specs: list[tuple[dict, dict]]) -> dict:
         "openapi": "3.1.0",
         "info": {
             "title": "船舶能效分析平台 API",
-            "description": (
-                "整合 Meta / Identity / Vessel / Data 四个微服务的 OpenAPI 文档。\n\n"
-                "每条路径通过 path-level `servers` 字段标明所属服务：\n\n"
-                "| 服务 | 地址 |\n"
-                "|------|------|\n"
-                "| Meta 元数据 | http://localhost:8000 |\n"
-                "| Identity 身份认证 | http://localhost:8001 |\n"
-                "| Vessel 船舶管理 | http://localhost:8002 |\n"
-                "| Data 遥测数据 | http://localhost:8003 |"
-            ),
+            "description": _INFO_DESCRIPTION,
             "version": "0.1.0",
         },
         "paths": {},
         "components": {"schemas": {}},
     }
 
+    # One server entry per service, shared by reference by every path item of that service
+    servers = {
+        svc["name"]: {"url": svc["server"], "description": svc["description"]}
+        for _, svc in service_specs
+    }
+
     # Health-check placeholder (one entry covering all services)
     combined["paths"]["/"] = {
         "get": {
@@ -117,27 +185,32 @@ def merge(service_specs: list[tuple[dict, dict]]) -> dict:
             "tags": ["健康检查"],
             "responses": {"200": {"description": "Successful Response"}},
         },
-        "servers": [
-            {"url": svc["server"], "description": svc["description"]} for _, svc in service_specs
-        ],
+        "servers": list(servers.values()),
     }
 
+    # The specs are owned by this script (built in worker processes), so they are rewritten
+    # in place instead of deep-copied.
     for spec, svc in service_specs:
         prefix = svc["prefix"]
+        path_servers = [servers[svc["name"]]]
+        seen: set[int] = set()
 
         # ── Prefix component schemas ──────────────────────────────────────
         for name, body in spec.get("components", {}).get("schemas", {}).items():
-            combined["components"]["schemas"][prefix + name] = _prefix_refs(
-                copy.deepcopy(body), prefix
-            )
+            _prefix_refs(body, prefix, seen)
+            combined["components"]["schemas"][prefix + name] = body
+
+        # ── Security schemes (operations refer to them by name, so no prefix) ──
+        for name, scheme in spec.get("components", {}).get("securitySchemes", {}).items():
+            combined["components"].setdefault("securitySchemes", {})[name] = scheme
 
         # ── Add paths ─────────────────────────────────────────────────────
         for path, item in spec.get("paths", {}).items():
             if path in _SKIP_PATHS:
                 continue
-            path_item = _prefix_refs(copy.deepcopy(item), prefix)
-            path_item["servers"] = [{"url": svc["server"], "description": svc["description"]}]
-            combined["paths"][path] = path_item
+            _prefix_refs(item, prefix, seen)
+            item["servers"] = path_servers
+            combined["paths"][path] = item
 
     return combined
 
@@ -145,30 +218,59 @@ def merge(service_specs: list[tuple[dict, dict]]) -> dict:
 # ── Entry point ───────────────────────────────────────────────────────────────
 
 
+def _build_spec(svc: dict) -> tuple[dict, dict]:
+    """Import one service's app and build its OpenAPI spec (runs in a worker process)."""
+    app_dir = str(_SERVICES_DIR / "apps" / svc["name"])
+    if app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+    app = _import_app(svc["module"], svc["attr"])
+    return app.openapi(), svc
+
+
 def main() -> None:
-    services_dir = Path(__file__).parent.parent
-
-    # Make each service package importable
-    for svc in SERVICES:
-        app_dir = str(services_dir / "apps" / svc["name"])
-        if app_dir not in sys.path:
-            sys.path.insert(0, app_dir)
-
-    service_specs: list[tuple[dict, dict]] = []
-    for svc in SERVICES:
-        print(f"  [{svc['name']}] generating spec ...", flush=True)
-        app = _import_app(svc["module"], svc["attr"])
-        spec = app.openapi()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--no-cache", action="store_true", help="rebuild every spec, ignoring docs/.openapi_cache"
+    )
+    args = parser.parse_args()
+
+    keys = [_source_hash(svc) for svc in SERVICES]
+    specs = [
+        None if args.no_cache else _read_cached_spec(svc, key)
+        for svc, key in zip(SERVICES, keys, strict=True)
+    ]
+    missing = [i for i, spec in enumerate(specs) if spec is None]
+    if missing:
+        # Services are imported and built in worker processes: the app imports dominate the
+        # runtime and are independent. Workers are capped at the core count; a worker that
+        # builds several services reuses the shared library imports.
+        workers = min(len(missing), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            built = pool.map(_build_spec, [SERVICES[i] for i in missing])
+            for i, (spec, svc) in zip(missing, built, strict=True):
+                _write_cached_spec(svc, keys[i], spec)
+                specs[i] = spec
+    print(f"  {len(SERVICES) - len(missing)} of {len(SERVICES)} specs from cache")
+    service_specs = list(zip(specs, SERVICES, strict=True))
+
+    for spec, svc in service_specs:
         n_paths = len(spec.get("paths", {}))
         n_schemas = len(spec.get("components", {}).get("schemas", {}))
         print(f"  [{svc['name']}] {n_paths} paths, {n_schemas} schemas")
-        service_specs.append((spec, svc))
 
     combined = merge(service_specs)
 
-    out_path = services_dir / "docs" / "openapi.json"
+    out_path = _SERVICES_DIR / "docs" / "openapi.json"
     out_path.parent.mkdir(exist_ok=True)
-    out_path.write_text(json.dumps(combined, ensure_ascii=False, indent=2), encoding="utf-8")
+    if orjson is not None:
+        # UTF-8 bytes straight from orjson; same layout as json.dumps(indent=2).
+        body = orjson.dumps(combined, option=orjson.OPT_INDENT_2)
+    else:
+        body = json.dumps(combined, ensure_ascii=False, indent=2).encode()
+    # Write next to the target and rename over it, so readers never see a half-written file.
+    tmp_path = out_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(body)
+    os.replace(tmp_path, out_path)
 
     total_paths = len(combined["paths"])
     total_schemas = len(combined["components"]["schemas"])